@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 """
 Build script for OnionInstaller.
-Creates a standalone binary using PyInstaller for the current platform.
-Output goes to releases/.
+Creates a standalone app directory using PyInstaller for the current platform,
+plus an archive of it for distribution. Output goes to releases/.
 
 Usage:
     python3 build.py          # auto-creates a venv if needed
     .venv/bin/python build.py # use an existing venv
+
+PyInstaller's analysis cache in build/ is kept between runs so rebuilds are
+incremental. Set ONION_CLEAN_BUILD=1 to start from scratch and remove build/
+afterwards.
 """
 
+import ast
+import hashlib
 import os
 import platform
 import shutil
@@ -20,6 +26,12 @@ ROOT = Path(__file__).parent.resolve()
 RELEASES_DIR = ROOT / "releases"
 VENV_DIR = ROOT / ".venv"
 
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Used when no gi.repository imports can be found in the sources.
+_DEFAULT_GI_MODULES = ("Gtk", "Gdk", "GLib", "Pango", "GdkPixbuf")
+
 
 def _in_venv():
     """Check if we're running inside a virtual environment."""
@@ -33,7 +45,7 @@ def _relaunch_in_venv():
         sys.executable, "-m", "venv",
         "--system-site-packages", str(VENV_DIR),
     ])
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         venv_python = VENV_DIR / "Scripts" / "python.exe"
     else:
         venv_python = VENV_DIR / "bin" / "python3"
@@ -51,8 +63,8 @@ def ensure_pyinstaller():
 
 
 def get_output_name():
-    """Return the platform-specific binary name."""
-    system = platform.system().lower()
+    """Return the platform-specific app directory / launcher name."""
+    system = _SYSTEM.lower()
     machine = platform.machine().lower()
 
     # Normalize architecture names
@@ -62,11 +74,50 @@ def get_output_name():
         machine = "arm64"
 
     if system == "windows":
-        return f"WindowsOnionDesktopTools-{machine}.exe"
+        return f"WindowsOnionDesktopTools-{machine}"
     else:
         return f"LinuxOnionDesktopTools-{machine}"
 
 
+def _gi_hidden_imports():
+    """Return the gi modules to pass to PyInstaller as hidden imports.
+
+    Scans main.py and lib/ for ``from gi.repository import X`` and
+    ``import gi.repository.X`` so only typelibs the app uses get bundled.
+    """
+    needed = set()
+    for path in [ROOT / "main.py", *sorted((ROOT / "lib").glob("*.py"))]:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module == "gi.repository":
+                needed.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name.startswith("gi.repository."):
+                        needed.add(alias.name.split(".")[2])
+
+    if not needed:
+        needed = set(_DEFAULT_GI_MODULES)
+    return ["gi"] + [f"gi.repository.{name}" for name in sorted(needed)]
+
+
+def _png_to_ico(png_path, ico_path):
+    """Convert the PNG icon to a multi-size ICO, skipping it if up to date.
+
+    The PNG's SHA-256 is stored next to the ICO; when it still matches,
+    the existing ICO is reused. Raises ImportError if Pillow is missing.
+    """
+    png_hash = hashlib.sha256(png_path.read_bytes()).hexdigest()
+    hash_path = ico_path.with_name(ico_path.name + ".hash")
+    if ico_path.exists() and hash_path.exists() and hash_path.read_text().strip() == png_hash:
+        return
+
+    from PIL import Image
+    img = Image.open(png_path)
+    img.save(ico_path, format="ICO", sizes=[(16, 16), (32, 32), (48, 48), (256, 256)])
+    hash_path.write_text(png_hash + "\n")
+
+
 def build():
     # If not in a venv, create one and re-exec so pip works on managed systems
     if not _in_venv():
@@ -77,75 +128,83 @@ def build():
     RELEASES_DIR.mkdir(exist_ok=True)
 
     output_name = get_output_name()
-    separator = ";" if platform.system() == "Windows" else ":"
+    clean = bool(os.environ.get("ONION_CLEAN_BUILD"))
+    separator = ";" if _IS_WINDOWS else ":"
 
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
+        # onedir starts instantly; onefile unpacks itself to a temp dir on
+        # every launch.
+        "--onedir",
         "--name", output_name,
         "--noconfirm",
-        "--clean",
+        # Write straight into releases/ and keep the spec with the other
+        # intermediate files, so there is nothing to move afterwards.
+        "--distpath", str(RELEASES_DIR),
+        "--workpath", str(ROOT / "build"),
+        "--specpath", str(ROOT / "build"),
+        # UPX-packed libraries have to be unpacked at every launch, which
+        # undoes the onedir startup gain.
+        "--noupx",
     ]
+    if clean:
+        cmd.append("--clean")
+
+    # Strip debug symbols from bundled shared libraries (GTK, Pango, ...).
+    # Not applied on Windows, where strip does not handle PE files cleanly.
+    if not _IS_WINDOWS:
+        cmd.append("--strip")
 
     # Application icon
     icon_path = ROOT / "icon.png"
     if icon_path.exists():
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # Convert PNG to ICO for Windows
             try:
-                from PIL import Image
                 ico_path = ROOT / "icon.ico"
-                img = Image.open(icon_path)
-                img.save(ico_path, format="ICO", sizes=[(16, 16), (32, 32), (48, 48), (256, 256)])
+                _png_to_ico(icon_path, ico_path)
                 cmd += ["--icon", str(ico_path)]
             except ImportError:
                 print("Warning: Pillow not available, skipping Windows icon")
         else:
             cmd += ["--icon", str(icon_path)]
 
-    # Bundle data files
+    # Bundle data files (absolute paths: PyInstaller resolves relative ones
+    # against --specpath)
     if (ROOT / "config.json").exists():
-        cmd += ["--add-data", f"config.json{separator}."]
+        cmd += ["--add-data", f"{ROOT / 'config.json'}{separator}."]
     if (ROOT / "resources").is_dir():
-        cmd += ["--add-data", f"resources{separator}resources"]
+        cmd += ["--add-data", f"{ROOT / 'resources'}{separator}resources"]
     if icon_path.exists():
-        cmd += ["--add-data", f"icon.png{separator}."]
+        cmd += ["--add-data", f"{icon_path}{separator}."]
 
     # Hidden imports for PyGObject/GTK3
-    for module in [
-        "gi",
-        "gi.repository.Gtk",
-        "gi.repository.Gdk",
-        "gi.repository.GLib",
-        "gi.repository.Pango",
-        "gi.repository.GdkPixbuf",
-    ]:
+    for module in _gi_hidden_imports():
         cmd += ["--hidden-import", module]
 
-    cmd.append("main.py")
+    cmd.append(str(ROOT / "main.py"))
 
     print(f"Building {output_name}...")
     print(f"Command: {' '.join(cmd)}")
     subprocess.check_call(cmd, cwd=str(ROOT))
 
-    # Move binary from dist/ to releases/
-    built = ROOT / "dist" / output_name
     dest = RELEASES_DIR / output_name
 
-    if dest.exists():
-        dest.unlink()
-    shutil.move(str(built), str(dest))
+    # Archive the directory for distribution
+    archive_format = "zip" if _IS_WINDOWS else "gztar"
+    archive = Path(shutil.make_archive(
+        str(dest), archive_format, root_dir=RELEASES_DIR, base_dir=output_name,
+    ))
 
-    # Clean up build artifacts
-    for d in (ROOT / "build", ROOT / "dist"):
-        if d.exists():
-            shutil.rmtree(d)
-    spec_file = ROOT / f"{output_name}.spec"
-    if spec_file.exists():
-        spec_file.unlink()
+    # Clean up build artifacts (the spec file lives in build/ too); by
+    # default they are kept as PyInstaller's cache for the next build
+    build_dir = ROOT / "build"
+    if clean and build_dir.exists():
+        shutil.rmtree(build_dir)
 
     print(f"Build complete: {dest}")
-    print(f"Size: {dest.stat().st_size / (1024 * 1024):.1f} MB")
+    print(f"Archive: {archive}")
+    print(f"Size: {archive.stat().st_size / (1024 * 1024):.1f} MB")
 
 
 if __name__ == "__main__":
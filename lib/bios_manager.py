@@ -7,13 +7,22 @@ and installs to the SD card's BIOS/ directory.
 """
 
 import hashlib
+import http.client
 import logging
+import os
 import shutil
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+
+from lib.http_util import ConnectionPool, open_url
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +30,12 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
-CHUNK_SIZE = 64 * 1024  # 64 KiB
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per network read
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB per read when hashing on Python < 3.11
+PROGRESS_INTERVAL = 0.1  # seconds between per-file download progress callbacks
 NETWORK_TIMEOUT = 60  # seconds (BIOS files can be large)
+MAX_PARALLEL_DOWNLOADS = 4  # concurrent connections to the GitHub CDN
+MAX_PARALLEL_COPIES = 4  # concurrent file copies to the SD card
 
 _BASE_RAW_URL = (
     "https://raw.githubusercontent.com/Abdess/retroarch_system/libretro/"
@@ -41,155 +54,174 @@ _SYSTEM_TO_REPO_PATH = {
     "Neo Geo CD": "SNK - NeoGeo CD/",
 }
 
+# Keep-alive HTTP connections, one pool per download thread, so the TCP/TLS
+# handshake to the CDN is paid once per worker instead of once per file.
+# download_all_bios closes its workers' pools when the batch is done.
+_thread_local = threading.local()
+
 # ---------------------------------------------------------------------------
 # BIOS file definitions
 # ---------------------------------------------------------------------------
 
-BIOS_FILES = [
+
+@dataclass(slots=True, frozen=True)
+class BiosEntry:
+    """A BIOS file the emulators expect in the SD card's BIOS/ directory.
+
+    ``md5`` may be empty when no reference checksum is known, in which case
+    verification is skipped. ``size`` is the expected size in bytes (0 if
+    unknown) and lets a truncated file be rejected without hashing it.
+    ``extra_copies`` are paths relative to the SD card root that receive an
+    additional copy of the file. ``relpath`` is
+    derived from ``subdir`` and ``filename`` and is relative to both the
+    cache directory and the SD card's BIOS/ directory.
+    """
+
+    filename: str
+    system: str
+    md5: str
+    required: bool
+    size: int = 0
+    subdir: str = ""
+    extra_copies: tuple[str, ...] = ()
+    notes: str = ""
+    relpath: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        relpath = (self.subdir, self.filename) if self.subdir else (self.filename,)
+        object.__setattr__(self, "relpath", relpath)
+
+
+BIOS_FILES: tuple[BiosEntry, ...] = (
     # --- PlayStation (required) ---
-    {
-        "filename": "scph1001.bin",
-        "system": "PlayStation",
-        "md5": "924e392ed05558ffdb115408c263dccf",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "PS1 BIOS (North America)",
-    },
-    {
-        "filename": "scph5500.bin",
-        "system": "PlayStation",
-        "md5": "8dd7d5296a650fac7319bce665a6a53c",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "PS1 BIOS (Japan)",
-    },
-    {
-        "filename": "scph5501.bin",
-        "system": "PlayStation",
-        "md5": "490f666e1afb15b7362b406ed1cea246",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "PS1 BIOS (North America)",
-    },
-    {
-        "filename": "scph5502.bin",
-        "system": "PlayStation",
-        "md5": "32736f17079d0b2b7024407c39bd3050",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "PS1 BIOS (Europe)",
-    },
+    BiosEntry(
+        "scph1001.bin",
+        "PlayStation",
+        md5="924e392ed05558ffdb115408c263dccf",
+        required=True,
+        size=524288,
+        notes="PS1 BIOS (North America)",
+    ),
+    BiosEntry(
+        "scph5500.bin",
+        "PlayStation",
+        md5="8dd7d5296a650fac7319bce665a6a53c",
+        required=True,
+        size=524288,
+        notes="PS1 BIOS (Japan)",
+    ),
+    BiosEntry(
+        "scph5501.bin",
+        "PlayStation",
+        md5="490f666e1afb15b7362b406ed1cea246",
+        required=True,
+        size=524288,
+        notes="PS1 BIOS (North America)",
+    ),
+    BiosEntry(
+        "scph5502.bin",
+        "PlayStation",
+        md5="32736f17079d0b2b7024407c39bd3050",
+        required=True,
+        size=524288,
+        notes="PS1 BIOS (Europe)",
+    ),
     # --- Neo Geo (required) ---
-    {
-        "filename": "neogeo.zip",
-        "system": "Neo Geo",
-        "md5": "",
-        "required": True,
-        "subdir": "",
-        "extra_copies": ["Roms/NEOGEO/neogeo.zip"],
-        "notes": "Neo Geo BIOS (also needed in Roms/NEOGEO/)",
-    },
+    BiosEntry(
+        "neogeo.zip",
+        "Neo Geo",
+        md5="",
+        required=True,
+        extra_copies=("Roms/NEOGEO/neogeo.zip",),
+        notes="Neo Geo BIOS (also needed in Roms/NEOGEO/)",
+    ),
     # --- Sega CD (required) ---
-    {
-        "filename": "bios_CD_U.bin",
-        "system": "Sega CD",
-        "md5": "2efd74e3232ff260e371b99f84024f7f",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Sega CD BIOS (North America)",
-    },
-    {
-        "filename": "bios_CD_E.bin",
-        "system": "Sega CD",
-        "md5": "e66fa1dc5820d254611fdcdba0662372",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Sega CD BIOS (Europe)",
-    },
-    {
-        "filename": "bios_CD_J.bin",
-        "system": "Sega CD",
-        "md5": "278a9397d192149e84e820ac621a8edd",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Sega CD BIOS (Japan)",
-    },
+    BiosEntry(
+        "bios_CD_U.bin",
+        "Sega CD",
+        md5="2efd74e3232ff260e371b99f84024f7f",
+        required=True,
+        size=131072,
+        notes="Sega CD BIOS (North America)",
+    ),
+    BiosEntry(
+        "bios_CD_E.bin",
+        "Sega CD",
+        md5="e66fa1dc5820d254611fdcdba0662372",
+        required=True,
+        size=131072,
+        notes="Sega CD BIOS (Europe)",
+    ),
+    BiosEntry(
+        "bios_CD_J.bin",
+        "Sega CD",
+        md5="278a9397d192149e84e820ac621a8edd",
+        required=True,
+        size=131072,
+        notes="Sega CD BIOS (Japan)",
+    ),
     # --- TurboGrafx-CD (required) ---
-    {
-        "filename": "syscard3.pce",
-        "system": "TurboGrafx-CD",
-        "md5": "38179df8f4ac870017db21ebcbf53114",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "TurboGrafx-CD / PC Engine CD System Card 3",
-    },
+    BiosEntry(
+        "syscard3.pce",
+        "TurboGrafx-CD",
+        md5="38179df8f4ac870017db21ebcbf53114",
+        required=True,
+        size=262144,
+        notes="TurboGrafx-CD / PC Engine CD System Card 3",
+    ),
     # --- Saturn (required) ---
-    {
-        "filename": "mpr-17933.bin",
-        "system": "Saturn",
-        "md5": "3240872c70984b6cbfda1586cab68dbe",
-        "required": True,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Sega Saturn BIOS (Europe)",
-    },
+    BiosEntry(
+        "mpr-17933.bin",
+        "Saturn",
+        md5="3240872c70984b6cbfda1586cab68dbe",
+        required=True,
+        size=524288,
+        notes="Sega Saturn BIOS (Europe)",
+    ),
     # --- GBA (optional) ---
-    {
-        "filename": "gba_bios.bin",
-        "system": "GBA",
-        "md5": "a860e8c0b6d573d191e4ec7db1b1e4f6",
-        "required": False,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Game Boy Advance BIOS (optional, HLE available)",
-    },
+    BiosEntry(
+        "gba_bios.bin",
+        "GBA",
+        md5="a860e8c0b6d573d191e4ec7db1b1e4f6",
+        required=False,
+        size=16384,
+        notes="Game Boy Advance BIOS (optional, HLE available)",
+    ),
     # --- GB / GBC (optional) ---
-    {
-        "filename": "gb_bios.bin",
-        "system": "GB",
-        "md5": "32fbbd84168d3482956eb3c5051637f5",
-        "required": False,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Game Boy BIOS (optional)",
-    },
-    {
-        "filename": "gbc_bios.bin",
-        "system": "GBC",
-        "md5": "dbfce9db9deaa2567f6a84fde55f9680",
-        "required": False,
-        "subdir": "",
-        "extra_copies": [],
-        "notes": "Game Boy Color BIOS (optional)",
-    },
+    BiosEntry(
+        "gb_bios.bin",
+        "GB",
+        md5="32fbbd84168d3482956eb3c5051637f5",
+        required=False,
+        size=256,
+        notes="Game Boy BIOS (optional)",
+    ),
+    BiosEntry(
+        "gbc_bios.bin",
+        "GBC",
+        md5="dbfce9db9deaa2567f6a84fde55f9680",
+        required=False,
+        size=2304,
+        notes="Game Boy Color BIOS (optional)",
+    ),
     # --- Neo Geo CD (optional) ---
-    {
-        "filename": "neocd_f.rom",
-        "system": "Neo Geo CD",
-        "md5": "",
-        "required": False,
-        "subdir": "neocd",
-        "extra_copies": [],
-        "notes": "Neo Geo CD front loader BIOS",
-    },
-    {
-        "filename": "000-lo.lo",
-        "system": "Neo Geo CD",
-        "md5": "",
-        "required": False,
-        "subdir": "neocd",
-        "extra_copies": [],
-        "notes": "Neo Geo CD load order file",
-    },
-]
+    BiosEntry(
+        "neocd_f.rom",
+        "Neo Geo CD",
+        md5="",
+        required=False,
+        subdir="neocd",
+        notes="Neo Geo CD front loader BIOS",
+    ),
+    BiosEntry(
+        "000-lo.lo",
+        "Neo Geo CD",
+        md5="",
+        required=False,
+        subdir="neocd",
+        notes="Neo Geo CD load order file",
+    ),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -197,22 +229,140 @@ BIOS_FILES = [
 # ---------------------------------------------------------------------------
 
 
-def _build_download_url(bios_entry: dict) -> str:
+def _build_download_url(bios_entry: BiosEntry) -> str:
     """Build the raw GitHub URL for a BIOS file."""
-    system = bios_entry["system"]
+    system = bios_entry.system
     repo_path = _SYSTEM_TO_REPO_PATH.get(system, "")
-    filename = bios_entry["filename"]
+    filename = bios_entry.filename
     # Percent-encode spaces and special chars in the path, but preserve slashes
     encoded_path = quote(f"{repo_path}{filename}", safe="/")
     return f"{_BASE_RAW_URL}{encoded_path}"
 
 
-def _cache_path_for(bios_entry: dict, cache_dir: Path) -> Path:
+def _pool() -> ConnectionPool:
+    """Return this thread's keep-alive connection pool."""
+    pool = getattr(_thread_local, "pool", None)
+    if pool is None:
+        pool = _thread_local.pool = ConnectionPool(NETWORK_TIMEOUT)
+    return pool
+
+
+def _drop_connections() -> None:
+    """Close all of this thread's connections."""
+    _pool().close()
+
+
+def _register_pool(registry: list[ConnectionPool]) -> None:
+    """Worker initializer: give the thread a pool kept in *registry*."""
+    _thread_local.pool = ConnectionPool(NETWORK_TIMEOUT)
+    registry.append(_thread_local.pool)
+
+
+def _open_download(url: str) -> http.client.HTTPResponse:
+    """Open a GET response for *url* over the thread's keep-alive connections."""
+    return open_url(url, _pool())
+
+
+class _DownloadSink:
+    """File wrapper that MD5-hashes and counts bytes as copyfileobj writes them."""
+
+    def __init__(
+        self,
+        fh,
+        filename: str,
+        total: int,
+        progress_cb: Optional[Callable[[str, int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        self._fh = fh
+        self._filename = filename
+        self._total = total
+        self._progress_cb = progress_cb
+        self._cancel_event = cancel_event
+        self._last_report = 0.0
+        self.hasher = hashlib.md5()
+        self.downloaded = 0
+
+    def write(self, chunk: bytes) -> int:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise InterruptedError(f"Download of {self._filename} cancelled")
+        written = self._fh.write(chunk)
+        self.hasher.update(chunk)
+        self.downloaded += len(chunk)
+        if self._progress_cb:
+            now = time.monotonic()
+            if now - self._last_report >= PROGRESS_INTERVAL or self.downloaded == self._total:
+                self._last_report = now
+                self._progress_cb(self._filename, self.downloaded, self._total)
+        return written
+
+
+def _cache_path_for(bios_entry: BiosEntry, cache_dir: Path) -> Path:
     """Return the local cache path for a BIOS file, including subdirectory."""
-    subdir = bios_entry.get("subdir", "")
-    if subdir:
-        return cache_dir / subdir / bios_entry["filename"]
-    return cache_dir / bios_entry["filename"]
+    return cache_dir.joinpath(*bios_entry.relpath)
+
+
+def _list_files(directory: Path) -> set[str]:
+    """Return the names of regular files in *directory* (empty if missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name for e in it if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _scan_bios_dir(base_dir: Path) -> dict[str, bool]:
+    """Map each BIOS filename to whether it exists under *base_dir*.
+
+    Each directory is listed once with os.scandir instead of stat-ing every
+    file, which matters on slow SD card readers.
+    """
+    listings: dict[str, set[str]] = {}
+    result = {}
+    for entry in BIOS_FILES:
+        if entry.subdir not in listings:
+            listings[entry.subdir] = _list_files(base_dir / entry.subdir)
+        result[entry.filename] = entry.filename in listings[entry.subdir]
+    return result
+
+
+def _stamp_path(path: Path) -> Path:
+    """Return the path of the verification stamp kept next to a cache file."""
+    return path.with_name(path.name + ".verified")
+
+
+def _is_verified_fresh(path: Path, expected_md5: str) -> bool:
+    """Return True if *path* has a stamp matching its size, mtime and digest.
+
+    A stamp is written after a successful verification, so a match means
+    the file has not changed since it was last hashed.
+    """
+    try:
+        st = path.stat()
+        stamp = _stamp_path(path).read_text().strip()
+    except OSError:
+        return False
+    return stamp == f"{st.st_size}:{int(st.st_mtime)}:{expected_md5.lower()}"
+
+
+def _write_verified_stamp(path: Path, digest: str) -> None:
+    """Record that *path* currently hashes to *digest*."""
+    try:
+        st = path.stat()
+        _stamp_path(path).write_text(f"{st.st_size}:{int(st.st_mtime)}:{digest.lower()}\n")
+    except OSError as exc:
+        logger.debug("Could not write verification stamp for %s: %s", path.name, exc)
+
+
+def _verify_cached(path: Path, bios_entry: BiosEntry) -> bool:
+    """Verify a cached file, skipping the hash when its stamp is still fresh."""
+    expected_md5 = bios_entry.md5
+    if not expected_md5 or _is_verified_fresh(path, expected_md5):
+        return True
+    if verify_md5(path, expected_md5, bios_entry.size or None):
+        _write_verified_stamp(path, expected_md5)
+        return True
+    return False
 
 
 # ---------------------------------------------------------------------------
@@ -220,80 +370,128 @@ def _cache_path_for(bios_entry: dict, cache_dir: Path) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def verify_md5(file_path: Path, expected_md5: str) -> bool:
+def verify_md5(
+    file_path: Path,
+    expected_md5: str,
+    expected_size: Optional[int] = None,
+) -> bool:
     """Verify the MD5 checksum of a file.
 
     Returns True if the checksum matches or if expected_md5 is empty (skip).
+    If expected_size is given, a file of any other size fails without being
+    read.
     """
+    if expected_size and os.stat(file_path).st_size != expected_size:
+        logger.warning(
+            "Size mismatch for %s: expected %d bytes", file_path.name, expected_size
+        )
+        return False
+
     if not expected_md5:
         return True
 
-    md5 = hashlib.md5()
     with open(file_path, "rb") as f:
-        while True:
-            chunk = f.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            md5.update(chunk)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, "md5").hexdigest()
+        else:
+            hasher = hashlib.md5()
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
 
-    result = md5.hexdigest() == expected_md5.lower()
+    result = digest == expected_md5.lower()
     if not result:
         logger.warning(
             "MD5 mismatch for %s: expected %s, got %s",
             file_path.name,
             expected_md5,
-            md5.hexdigest(),
+            digest,
         )
     return result
 
 
 def download_bios_file(
-    bios_entry: dict,
+    bios_entry: BiosEntry,
     cache_dir: Path,
     progress_cb: Optional[Callable[[str, int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> tuple[bool, str]:
     """Download a single BIOS file to the cache directory.
 
+    If *cancel_event* is set, the download stops before its next chunk and
+    the partial file is removed.
+
     Returns (success, message).
     """
     url = _build_download_url(bios_entry)
     dest = _cache_path_for(bios_entry, cache_dir)
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    filename = bios_entry["filename"]
+    filename = bios_entry.filename
+    expected_md5 = bios_entry.md5
     logger.info("Downloading %s from %s", filename, url)
 
+    if cancel_event is not None and cancel_event.is_set():
+        return False, f"Download of {filename} cancelled"
+
     try:
-        request = Request(url)
-        with urlopen(request, timeout=NETWORK_TIMEOUT) as response:
-            total = int(response.headers.get("Content-Length", 0))
-            downloaded = 0
+        response = _open_download(url)
+        try:
+            if response.status != 200:
+                response.read()  # drain so the connection can be reused
+                return False, f"HTTP {response.status} downloading {filename}: {response.reason}"
+
+            total = int(response.getheader("Content-Length", 0))
 
+            # Hash while streaming so the file never has to be read back
+            # from disk.
             with open(dest, "wb") as fh:
-                while True:
-                    chunk = response.read(CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    fh.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_cb:
-                        progress_cb(filename, downloaded, total)
+                sink = _DownloadSink(fh, filename, total, progress_cb, cancel_event)
+                shutil.copyfileobj(response, sink, DOWNLOAD_CHUNK_SIZE)
+        finally:
+            response.close()
 
+    except InterruptedError as exc:
+        _drop_connections()  # the rest of the response was never read
+        dest.unlink(missing_ok=True)
+        return False, str(exc)
     except HTTPError as exc:
         return False, f"HTTP {exc.code} downloading {filename}: {exc.reason}"
-    except URLError as exc:
-        return False, f"Network error downloading {filename}: {exc.reason}"
-    except TimeoutError:
+    except TimeoutError:  # also socket.timeout, an alias since Python 3.10
+        _drop_connections()
         return False, f"Timeout downloading {filename}"
+    except (
+        URLError, http.client.HTTPException, ConnectionError, ssl.SSLError, socket.gaierror
+    ) as exc:
+        _drop_connections()
+        return False, f"Network error downloading {filename}: {exc}"
     except OSError as exc:
+        _drop_connections()
         return False, f"File error saving {filename}: {exc}"
 
-    # Verify MD5 if provided
-    if not verify_md5(dest, bios_entry.get("md5", "")):
+    if bios_entry.size and sink.downloaded != bios_entry.size:
+        dest.unlink(missing_ok=True)
+        return False, (
+            f"Size mismatch for {filename}: expected {bios_entry.size} bytes, "
+            f"got {sink.downloaded}"
+        )
+
+    # Verify checksum if provided
+    digest = sink.hasher.hexdigest()
+    if expected_md5 and digest != expected_md5.lower():
+        logger.warning(
+            "MD5 mismatch for %s: expected %s, got %s",
+            filename,
+            expected_md5,
+            digest,
+        )
         dest.unlink(missing_ok=True)
         return False, f"MD5 verification failed for {filename}"
 
-    logger.info("Downloaded and verified %s (%d bytes)", filename, downloaded)
+    if expected_md5:
+        _write_verified_stamp(dest, digest)
+
+    logger.info("Downloaded and verified %s (%d bytes)", filename, sink.downloaded)
     return True, f"Downloaded {filename}"
 
 
@@ -302,11 +500,7 @@ def scan_cached_bios(cache_dir: Path) -> dict[str, bool]:
 
     Returns a dict mapping filename to whether it exists in cache.
     """
-    result = {}
-    for entry in BIOS_FILES:
-        path = _cache_path_for(entry, cache_dir)
-        result[entry["filename"]] = path.is_file()
-    return result
+    return _scan_bios_dir(cache_dir)
 
 
 def scan_sd_bios(sd_mount: Path) -> dict[str, bool]:
@@ -314,16 +508,7 @@ def scan_sd_bios(sd_mount: Path) -> dict[str, bool]:
 
     Returns a dict mapping filename to whether it exists in BIOS/ on the SD.
     """
-    bios_dir = sd_mount / "BIOS"
-    result = {}
-    for entry in BIOS_FILES:
-        subdir = entry.get("subdir", "")
-        if subdir:
-            path = bios_dir / subdir / entry["filename"]
-        else:
-            path = bios_dir / entry["filename"]
-        result[entry["filename"]] = path.is_file()
-    return result
+    return _scan_bios_dir(sd_mount / "BIOS")
 
 
 def download_all_bios(
@@ -331,6 +516,7 @@ def download_all_bios(
     progress_cb: Optional[Callable[[float, str], None]] = None,
     skip_cached: bool = True,
     required_only: bool = False,
+    cancel_event: Optional[threading.Event] = None,
 ) -> tuple[bool, list[str], list[str]]:
     """Download all BIOS files to the cache directory.
 
@@ -341,9 +527,12 @@ def download_all_bios(
     progress_cb : callable, optional
         Called as progress_cb(fraction, status_text).
     skip_cached : bool
-        If True, skip files that are already cached and pass MD5 verification.
+        If True, skip files that are already cached and pass checksum verification.
     required_only : bool
         If True, only download required BIOS files.
+    cancel_event : threading.Event, optional
+        Once set, running downloads stop and pending ones are reported as
+        failed without being started.
 
     Returns
     -------
@@ -352,34 +541,65 @@ def download_all_bios(
     """
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    files = [e for e in BIOS_FILES if not required_only or e["required"]]
+    files = [e for e in BIOS_FILES if not required_only or e.required]
     total = len(files)
     succeeded = []
     failed = []
+    pending = []
+    done = 0
 
-    for idx, entry in enumerate(files):
-        filename = entry["filename"]
-        frac = idx / max(total, 1)
+    for entry in files:
+        filename = entry.filename
 
         # Check cache
         if skip_cached:
             cached_path = _cache_path_for(entry, cache_dir)
-            if cached_path.is_file() and verify_md5(cached_path, entry.get("md5", "")):
+            if cached_path.is_file() and _verify_cached(cached_path, entry):
+                done += 1
                 if progress_cb:
-                    progress_cb(frac, f"Cached: {filename}")
+                    progress_cb(done / max(total, 1), f"Cached: {filename}")
                 succeeded.append(filename)
                 logger.info("Skipping %s (already cached and verified)", filename)
                 continue
 
+        pending.append(entry)
+
+    # Downloads are network-bound, so fetch several files at once. Results
+    # are collected on this thread, keeping progress_cb calls sequential.
+    if pending:
         if progress_cb:
-            progress_cb(frac, f"Downloading: {filename}")
+            progress_cb(done / max(total, 1), f"Downloading {len(pending)} files...")
 
-        ok, msg = download_bios_file(entry, cache_dir)
-        if ok:
-            succeeded.append(filename)
-        else:
-            failed.append(f"{filename}: {msg}")
-            logger.error("Failed to download %s: %s", filename, msg)
+        # The workers' keep-alive connections, closed once they have exited
+        worker_pools: list[ConnectionPool] = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=MAX_PARALLEL_DOWNLOADS,
+                initializer=_register_pool,
+                initargs=(worker_pools,),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        download_bios_file, entry, cache_dir, cancel_event=cancel_event
+                    ): entry.filename
+                    for entry in pending
+                }
+                for future in as_completed(futures):
+                    filename = futures[future]
+                    ok, msg = future.result()
+                    done += 1
+                    if ok:
+                        succeeded.append(filename)
+                        status = f"Downloaded: {filename}"
+                    else:
+                        failed.append(f"{filename}: {msg}")
+                        logger.error("Failed to download %s: %s", filename, msg)
+                        status = f"Failed: {filename}"
+                    if progress_cb:
+                        progress_cb(done / max(total, 1), status)
+        finally:
+            for pool in worker_pools:
+                pool.close()
 
     if progress_cb:
         progress_cb(1.0, "Download complete")
@@ -388,6 +608,41 @@ def download_all_bios(
     return all_ok, succeeded, failed
 
 
+def _copy_to_sd(src: Path, dest: Path) -> None:
+    """Copy *src* to *dest*, keeping only its timestamps.
+
+    FAT32 cannot store most of the metadata copy2 preserves, and copyfile
+    lets Linux use a kernel-side copy (sendfile / copy_file_range).
+    """
+    shutil.copyfile(src, dest)
+    st = src.stat()
+    os.utime(dest, (st.st_atime, st.st_mtime))
+
+
+def _install_one(entry: BiosEntry, cache_dir: Path, bios_dir: Path, sd_mount: Path) -> None:
+    """Copy one cached BIOS file (and its extra copies) onto the SD card.
+
+    Raises OSError if any copy fails.
+    """
+    filename = entry.filename
+    src = _cache_path_for(entry, cache_dir)
+
+    # Main copy to BIOS/ (with optional subdir)
+    dest = bios_dir.joinpath(*entry.relpath)
+    if entry.subdir:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+    _copy_to_sd(src, dest)
+    logger.info("Installed %s -> %s", filename, dest)
+
+    # Extra copies (e.g. neogeo.zip -> Roms/NEOGEO/)
+    for extra in entry.extra_copies:
+        extra_dest = sd_mount / extra
+        extra_dest.parent.mkdir(parents=True, exist_ok=True)
+        _copy_to_sd(src, extra_dest)
+        logger.info("Extra copy %s -> %s", filename, extra_dest)
+
+
 def install_bios_to_sd(
     cache_dir: Path,
     sd_mount: Path,
@@ -415,49 +670,43 @@ def install_bios_to_sd(
     bios_dir = sd_mount / "BIOS"
     bios_dir.mkdir(parents=True, exist_ok=True)
 
-    files = [e for e in BIOS_FILES if not required_only or e["required"]]
+    files = [e for e in BIOS_FILES if not required_only or e.required]
     total = len(files)
     succeeded = []
     failed = []
+    pending = []
+    done = 0
 
-    for idx, entry in enumerate(files):
-        filename = entry["filename"]
-        frac = idx / max(total, 1)
-
-        src = _cache_path_for(entry, cache_dir)
-        if not src.is_file():
+    for entry in files:
+        filename = entry.filename
+        if not _cache_path_for(entry, cache_dir).is_file():
+            done += 1
             failed.append(f"{filename}: not in cache")
             logger.warning("Skipping %s (not in cache)", filename)
             continue
-
-        if progress_cb:
-            progress_cb(frac, f"Installing: {filename}")
-
-        try:
-            # Main copy to BIOS/ (with optional subdir)
-            subdir = entry.get("subdir", "")
-            if subdir:
-                dest_dir = bios_dir / subdir
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                dest = dest_dir / filename
+        pending.append(entry)
+
+    # Overlap per-file open/FAT metadata latency on the SD card by copying
+    # a few files at once. Results are collected on this thread.
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_COPIES) as pool:
+        futures = {
+            pool.submit(_install_one, entry, cache_dir, bios_dir, sd_mount): entry.filename
+            for entry in pending
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            done += 1
+            try:
+                future.result()
+            except OSError as exc:
+                failed.append(f"{filename}: {exc}")
+                logger.error("Failed to install %s: %s", filename, exc)
+                status = f"Failed: {filename}"
             else:
-                dest = bios_dir / filename
-
-            shutil.copy2(src, dest)
-            logger.info("Installed %s -> %s", filename, dest)
-
-            # Extra copies (e.g. neogeo.zip -> Roms/NEOGEO/)
-            for extra in entry.get("extra_copies", []):
-                extra_dest = sd_mount / extra
-                extra_dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, extra_dest)
-                logger.info("Extra copy %s -> %s", filename, extra_dest)
-
-            succeeded.append(filename)
-
-        except OSError as exc:
-            failed.append(f"{filename}: {exc}")
-            logger.error("Failed to install %s: %s", filename, exc)
+                succeeded.append(filename)
+                status = f"Installed: {filename}"
+            if progress_cb:
+                progress_cb(done / max(total, 1), status)
 
     if progress_cb:
         progress_cb(1.0, "Installation complete")
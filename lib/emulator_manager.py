@@ -10,7 +10,9 @@ SD card root. ROM directories are never removed during uninstallation.
 """
 
 import logging
+import os
 import shutil
+import time
 from pathlib import Path
 from typing import Literal
 
@@ -27,6 +29,13 @@ _TYPE_MAP: dict[str, str] = {
     "App": "app",
 }
 
+# FAT stores modification times in 2-second steps, so a directory changed
+# less than this long ago may change again without its mtime moving.
+_MTIME_RESOLUTION_NS = 2_000_000_000
+
+# sd_mount -> (input mtimes, scan_packages() result); see scan_packages_cached.
+_scan_cache: dict[Path, tuple[tuple, list[dict[str, str | bool]]]] = {}
+
 
 def _rom_dir_for_package(sd_mount: Path, package_name: str) -> Path | None:
     """Return the ROM directory path that corresponds to a package name.
@@ -168,6 +177,78 @@ def scan_packages(
     return packages
 
 
+def _scan_inputs(sd_mount: Path, package_names: list[str]) -> list[Path]:
+    """Return the directories whose contents scan_packages() reads.
+
+    These are the SD root, Roms/, the installed Emu/RApp/App directories,
+    the staging directories, and the ROM directory of each package (adding
+    or removing a ROM changes that directory's mtime).
+    """
+    paths = [sd_mount, sd_mount / "Roms"]
+    for type_dir in PACKAGE_TYPES:
+        paths.append(sd_mount / type_dir)
+        paths.append(sd_mount / PACKAGE_DATA_DIR / type_dir)
+    for name in package_names:
+        rom_dir = _rom_dir_for_package(sd_mount, name)
+        if rom_dir is not None:
+            paths.append(rom_dir)
+    return paths
+
+
+def _mtimes(paths: list[Path]) -> tuple[int | None, ...]:
+    """Return the mtime of each path in nanoseconds (None if missing)."""
+    result = []
+    for path in paths:
+        try:
+            result.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            result.append(None)
+    return tuple(result)
+
+
+def scan_packages_cached(
+    sd_mount: Path,
+) -> list[dict[str, str | bool]]:
+    """Return scan_packages(sd_mount), reusing an earlier scan if still valid.
+
+    A scan is reused while the mtimes of every directory it read (see
+    _scan_inputs) are unchanged. Scans whose inputs changed within the
+    last two seconds are not cached, since FAT mtimes are too coarse to
+    notice a further change in that window.
+
+    Args:
+        sd_mount: Mount point of the SD card.
+
+    Returns:
+        The package list, as returned by scan_packages(). Do not modify it.
+    """
+    sd_mount = Path(sd_mount)
+    cached = _scan_cache.get(sd_mount)
+    if cached is not None:
+        key, packages = cached
+        names = [str(pkg["name"]) for pkg in packages]
+        if _mtimes(_scan_inputs(sd_mount, names)) == key:
+            return packages
+
+    packages = scan_packages(sd_mount)
+    key = _mtimes(_scan_inputs(sd_mount, [str(pkg["name"]) for pkg in packages]))
+    newest = max((m for m in key if m is not None), default=0)
+    if time.time_ns() - newest >= _MTIME_RESOLUTION_NS:
+        _scan_cache[sd_mount] = (key, packages)
+    else:
+        _scan_cache.pop(sd_mount, None)
+    return packages
+
+
+def invalidate_package_scan(sd_mount: Path) -> None:
+    """Drop the cached scan for *sd_mount* so the next one reads the card.
+
+    Args:
+        sd_mount: Mount point of the SD card.
+    """
+    _scan_cache.pop(Path(sd_mount), None)
+
+
 def install_package(
     sd_mount: Path, package_name: str, package_type: str
 ) -> tuple[bool, str]:
@@ -207,6 +288,7 @@ def install_package(
             f"Uninstall first if you want to reinstall."
         )
 
+    invalidate_package_scan(sd_mount)
     try:
         # Ensure the parent type directory exists
         destination.parent.mkdir(parents=True, exist_ok=True)
@@ -259,6 +341,7 @@ def uninstall_package(
             f"(directory not found: {target})"
         )
 
+    invalidate_package_scan(sd_mount)
     try:
         shutil.rmtree(target)
         logger.info(
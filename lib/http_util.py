@@ -0,0 +1,121 @@
+"""
+http_util.py - Keep-alive HTTP GETs with redirect and proxy handling.
+
+Shared by bios_manager and onion_installer. Requests go over persistent
+http.client connections so repeated downloads from the same host skip the
+TCP/TLS handshake; redirects are followed by hand, and URLs that the
+environment routes through a proxy fall back to urllib.request.urlopen.
+"""
+
+import http.client
+from typing import Optional
+from urllib.parse import SplitResult, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+MAX_REDIRECTS = 5  # Location hops followed per request
+
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+# ---------------------------------------------------------------------------
+# Connections
+# ---------------------------------------------------------------------------
+
+
+class ConnectionPool:
+    """Keep-alive connections, one per (scheme, host).
+
+    Not thread-safe: give each thread its own pool, or serialise access
+    with a lock.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+
+    def get(self, parts: SplitResult) -> http.client.HTTPConnection:
+        """Return the connection for *parts*' host, opening it if needed."""
+        key = (parts.scheme, parts.netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            if parts.scheme == "https":
+                conn = http.client.HTTPSConnection(parts.netloc, timeout=self.timeout)
+            else:
+                conn = http.client.HTTPConnection(parts.netloc, timeout=self.timeout)
+            self._connections[key] = conn
+        return conn
+
+    def drop(self, parts: SplitResult) -> None:
+        """Close and forget the connection for *parts*' host."""
+        conn = self._connections.pop((parts.scheme, parts.netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        """Close and forget every connection."""
+        while self._connections:
+            self._connections.popitem()[1].close()
+
+    def request(
+        self, parts: SplitResult, headers: Optional[dict[str, str]] = None,
+    ) -> http.client.HTTPResponse:
+        """Send a GET for *parts* and return the response.
+
+        If the server has closed the idle connection in the meantime, it is
+        reopened and the request is retried once.  The body must be read
+        completely before the pool is used again for the same host.
+        """
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        try:
+            conn = self.get(parts)
+            conn.request("GET", path, headers=headers or {})
+            return conn.getresponse()
+        except (ConnectionError, http.client.BadStatusLine):
+            self.drop(parts)
+            conn = self.get(parts)
+            conn.request("GET", path, headers=headers or {})
+            return conn.getresponse()
+
+
+# ---------------------------------------------------------------------------
+# Requests
+# ---------------------------------------------------------------------------
+
+
+def uses_proxy(parts: SplitResult) -> bool:
+    """Return True if the environment (``https_proxy`` etc.) proxies *parts*."""
+    return parts.scheme in getproxies() and not proxy_bypass(parts.hostname or "")
+
+
+def open_url(
+    url: str,
+    pool: ConnectionPool,
+    headers: Optional[dict[str, str]] = None,
+) -> http.client.HTTPResponse:
+    """Open a GET response for *url*, following up to MAX_REDIRECTS redirects.
+
+    Requests go over *pool*'s keep-alive connections and any status is
+    returned as-is.  When a proxy is configured for the URL, urlopen is
+    used instead; it honours the proxy, follows redirects itself and
+    raises HTTPError for error statuses.
+
+    Raises
+    ------
+    http.client.HTTPException
+        If the redirect limit is exceeded.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if uses_proxy(parts):
+            return urlopen(Request(url, headers=headers or {}), timeout=pool.timeout)
+        response = pool.request(parts, headers)
+        location = response.getheader("Location")
+        if response.status not in REDIRECT_STATUSES or not location:
+            return response
+        response.read()  # drain so the connection can be reused
+        url = urljoin(url, location)
+    raise http.client.HTTPException(f"Too many redirects (more than {MAX_REDIRECTS})")
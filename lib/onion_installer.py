@@ -9,10 +9,14 @@ Provides functions to fetch releases from GitHub, download release zips,
 extract them to an SD card mount point, and verify the installation.
 """
 
+import gzip
+import http.client
 import json
 import logging
 import os
 import re
+import tempfile
+import threading
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +24,8 @@ from typing import Any, Callable, Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from lib.http_util import ConnectionPool, open_url
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -36,7 +42,7 @@ APP_RELEASES_URL = (
 
 NETWORK_TIMEOUT = 30  # seconds
 
-CHUNK_SIZE = 64 * 1024  # 64 KiB per read during chunked downloads
+CHUNK_SIZE = 1 << 20  # 1 MiB per read during chunked downloads and extraction
 
 # Directories that must be present on the SD card after a successful extraction.
 EXPECTED_DIRS = [".tmp_update", "BIOS", "RetroArch", "miyoo", "Themes"]
@@ -44,6 +50,20 @@ EXPECTED_DIRS = [".tmp_update", "BIOS", "RetroArch", "miyoo", "Themes"]
 # GitHub API requests benefit from an explicit Accept header.
 _GITHUB_HEADERS = {"Accept": "application/vnd.github+json"}
 
+# Extra headers for API calls made over the shared keep-alive connection;
+# http.client sends no User-Agent of its own and GitHub rejects requests
+# without one.
+_GITHUB_API_HEADERS = {
+    **_GITHUB_HEADERS,
+    "Accept-Encoding": "gzip",
+    "User-Agent": "Onion-Desktop-Tools",
+}
+
+# Keep-alive connections shared by all threads and serialised by
+# _github_lock, so repeated API calls skip the TLS handshake.
+_github_pool = ConnectionPool(NETWORK_TIMEOUT)
+_github_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -59,23 +79,81 @@ def _github_get(url: str) -> Any:
         On any network / HTTP error so callers get a single exception type
         for transport-level problems.
     """
-    request = Request(url, headers=_GITHUB_HEADERS)
+    return _github_get_conditional(url)[0]
+
+
+def _github_get_conditional(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Optional[tuple[Any, Optional[str], Optional[str]]]:
+    """Conditional GET against the GitHub API.
+
+    Sends ``If-None-Match`` / ``If-Modified-Since`` when *etag* /
+    *last_modified* are given.  Redirects are followed and proxies from
+    the environment are honoured (see :func:`_github_fetch`).
+
+    Returns
+    -------
+    tuple or None
+        ``(data, etag, last_modified)`` for a 200 response, or *None* when
+        GitHub answers ``304 Not Modified`` (the body is not downloaded).
+
+    Raises
+    ------
+    ConnectionError
+        On any other network / HTTP error.
+    """
+    headers = dict(_GITHUB_API_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    with _github_lock:
+        try:
+            response, body = _github_fetch(url, headers)
+        except TimeoutError as exc:
+            _github_pool.close()
+            raise ConnectionError(
+                f"Request to {url} timed out after {NETWORK_TIMEOUT}s"
+            ) from exc
+        except (OSError, http.client.HTTPException) as exc:
+            _github_pool.close()
+            raise ConnectionError(f"Unable to reach {url}: {exc}") from exc
+
+    if response.status == 304:
+        return None
+    if response.status != 200:
+        raise ConnectionError(
+            f"GitHub API returned HTTP {response.status} for {url}: "
+            f"{response.reason}"
+        )
+
+    if response.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return (
+        json.loads(body),
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
+
+
+def _github_fetch(url: str, headers: dict[str, str]) -> tuple[Any, bytes]:
+    """GET *url* with :func:`lib.http_util.open_url` over the shared pool.
+
+    Must be called with ``_github_lock`` held.  Returns the final response
+    (an ``HTTPResponse``, or an ``HTTPError`` for error statuses on the
+    proxy path; both have ``status`` and ``headers``) and its still-encoded
+    body.
+    """
     try:
-        with urlopen(request, timeout=NETWORK_TIMEOUT) as response:
-            data = response.read()
-            return json.loads(data)
+        response = open_url(url, _github_pool, headers)
     except HTTPError as exc:
-        raise ConnectionError(
-            f"GitHub API returned HTTP {exc.code} for {url}: {exc.reason}"
-        ) from exc
-    except URLError as exc:
-        raise ConnectionError(
-            f"Unable to reach {url}: {exc.reason}"
-        ) from exc
-    except TimeoutError as exc:
-        raise ConnectionError(
-            f"Request to {url} timed out after {NETWORK_TIMEOUT}s"
-        ) from exc
+        with exc:
+            return exc, exc.read()
+    with response:
+        return response, response.read()
 
 
 def _find_zip_asset(assets: list[dict]) -> Optional[dict]:
@@ -86,38 +164,54 @@ def _find_zip_asset(assets: list[dict]) -> Optional[dict]:
     return None
 
 
-def _parse_version(tag: str) -> tuple:
-    """Extract a comparable version tuple from a tag string like ``v4.3.1``."""
-    match = re.search(r"(\d+(?:\.\d+)*)", tag)
-    if match:
-        return tuple(int(part) for part in match.group(1).split("."))
-    return (0,)
-
+def _load_releases_cache(cache_path: Path) -> Optional[dict[str, Any]]:
+    """Read the release cache written by :func:`_save_releases_cache`.
 
-# ---------------------------------------------------------------------------
-# Public API
-# ---------------------------------------------------------------------------
-
-
-def fetch_releases() -> dict[str, list[dict[str, Any]]]:
-    """Query the Onion OS GitHub releases and return categorised results.
+    Returns *None* if the file is missing, unreadable or malformed.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or not isinstance(cache.get("data"), dict):
+        return None
+    return cache
+
+
+def _save_releases_cache(cache_path: Path, cache: dict[str, Any]) -> None:
+    """Write *cache* to *cache_path* atomically.
+
+    The JSON goes to a temporary file in the same directory which is then
+    ``os.replace``-d over the cache, so readers (including other running
+    instances) never see a partially written file.  Failures are logged,
+    not raised -- the cache is only an optimisation.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+        )
+    except OSError as exc:
+        logger.warning("Could not write release cache %s: %s", cache_path, exc)
+        return
 
-    Returns
-    -------
-    dict
-        ``{"stable": [...], "beta": [...]}`` where each entry is a dict with
-        keys: *tag_name*, *name*, *prerelease*, *published_at*,
-        *browser_download_url*, *size*.
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Could not write release cache %s: %s", cache_path, exc)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
-    Raises
-    ------
-    ConnectionError
-        If the GitHub API cannot be reached or returns an error.
-    ValueError
-        If the response is not valid JSON or has an unexpected shape.
-    """
-    raw_releases: list[dict] = _github_get(ONION_RELEASES_URL)
 
+def _categorise_releases(
+    raw_releases: Any,
+) -> dict[str, list[dict[str, Any]]]:
+    """Split raw GitHub release objects into ``stable`` and ``beta`` lists."""
     if not isinstance(raw_releases, list):
         raise ValueError(
             "Unexpected GitHub API response: expected a JSON array of releases"
@@ -151,10 +245,103 @@ def fetch_releases() -> dict[str, list[dict[str, Any]]]:
     return {"stable": stable, "beta": beta}
 
 
+def _parse_version(tag: str) -> tuple:
+    """Extract a comparable version tuple from a tag string like ``v4.3.1``."""
+    match = re.search(r"(\d+(?:\.\d+)*)", tag)
+    if match:
+        return tuple(int(part) for part in match.group(1).split("."))
+    return (0,)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def load_cached_releases(
+    cache_path: str | Path,
+) -> Optional[dict[str, list[dict[str, Any]]]]:
+    """Return the release list last saved by :func:`fetch_releases`.
+
+    No network access; meant for showing something immediately while
+    :func:`fetch_releases` revalidates the list.
+
+    Returns
+    -------
+    dict or None
+        Same shape as :func:`fetch_releases`' result, or *None* if there
+        is no usable cache at *cache_path*.
+    """
+    cache = _load_releases_cache(Path(cache_path))
+    return cache["data"] if cache else None
+
+
+def fetch_releases(
+    cache_path: Optional[str | Path] = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Query the Onion OS GitHub releases and return categorised results.
+
+    Parameters
+    ----------
+    cache_path:
+        Optional JSON file used to cache the result.  Every call still asks
+        GitHub, revalidating the cache with its ``ETag`` /
+        ``Last-Modified``; a ``304 Not Modified`` reuses it without
+        downloading the list again, and it is also used as a fallback if
+        GitHub cannot be reached.
+
+    Returns
+    -------
+    dict
+        ``{"stable": [...], "beta": [...]}`` where each entry is a dict with
+        keys: *tag_name*, *name*, *prerelease*, *published_at*,
+        *browser_download_url*, *size*.
+
+    Raises
+    ------
+    ConnectionError
+        If the GitHub API cannot be reached or returns an error and there is
+        no cached copy to fall back on.
+    ValueError
+        If the response is not valid JSON or has an unexpected shape.
+    """
+    cache = None
+    if cache_path is not None:
+        cache_path = Path(cache_path)
+        cache = _load_releases_cache(cache_path)
+
+    try:
+        result = _github_get_conditional(
+            ONION_RELEASES_URL,
+            etag=cache.get("etag") if cache else None,
+            last_modified=cache.get("last_modified") if cache else None,
+        )
+    except ConnectionError as exc:
+        if cache:
+            logger.warning("Using cached release list: %s", exc)
+            return cache["data"]
+        raise
+
+    if result is None:
+        # 304 Not Modified -- only possible when we sent the cached validators.
+        return cache["data"]
+
+    raw_releases, etag, last_modified = result
+    data = _categorise_releases(raw_releases)
+    if cache_path is not None:
+        _save_releases_cache(cache_path, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": data,
+        })
+    return data
+
+
 def download_release(
     url: str,
     dest_dir: str | Path,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Path:
     """Download a release zip from *url* into *dest_dir*.
 
@@ -169,6 +356,9 @@ def download_release(
         Optional callable invoked as ``progress_callback(bytes_downloaded,
         total_bytes)`` after each chunk.  *total_bytes* may be ``0`` when the
         server does not send a ``Content-Length`` header.
+    cancel_event:
+        Optional event checked before each chunk; once it is set the
+        partial file is removed and :class:`InterruptedError` is raised.
 
     Returns
     -------
@@ -182,6 +372,8 @@ def download_release(
     OSError
         If the destination directory cannot be created or the file cannot be
         written.
+    InterruptedError
+        If *cancel_event* was set during the download.
     """
     dest_dir = Path(dest_dir)
     dest_dir.mkdir(parents=True, exist_ok=True)
@@ -199,6 +391,8 @@ def download_release(
 
             with open(dest_path, "wb") as fh:
                 while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise InterruptedError(f"Download of {filename} cancelled")
                     chunk = response.read(CHUNK_SIZE)
                     if not chunk:
                         break
@@ -207,6 +401,9 @@ def download_release(
                     if progress_callback is not None:
                         progress_callback(bytes_downloaded, total_bytes)
 
+    except InterruptedError:
+        dest_path.unlink(missing_ok=True)
+        raise
     except HTTPError as exc:
         raise ConnectionError(
             f"Download failed with HTTP {exc.code}: {exc.reason}"
@@ -125,7 +125,9 @@ def list_removable_drives() -> list[dict]:
     list[dict]
         Each dict contains the keys: ``name``, ``size``, ``type``,
         ``mountpoint``, ``fstype``, ``rm``, ``model``, ``tran``, ``label``,
-        and the synthetic ``device`` key (e.g. ``/dev/sdb``).
+        the synthetic ``device`` key (e.g. ``/dev/sdb``) and ``display``, a
+        ready-made one-line description such as
+        ``/dev/sdb - 29.7G - SD Card Reader [ONION]``.
     """
     result = _run([
         "lsblk", "-J", "-o",
@@ -170,6 +172,10 @@ def list_removable_drives() -> list[dict]:
             "label": dev.get("label"),
             "children": dev.get("children", []),
         }
+        display = f"{drive_info['device']} - {drive_info['size']} - {drive_info['model']}"
+        if drive_info["label"]:
+            display += f" [{drive_info['label']}]"
+        drive_info["display"] = display
         drives.append(drive_info)
 
     return drives
@@ -7,13 +7,13 @@ Manages Onion OS installation on Miyoo Mini/Mini+ SD cards.
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk, GLib, Pango, GdkPixbuf
+from gi.repository import Gtk, Gdk, GLib, Gio, Pango, GdkPixbuf
 
 import os
-import sys
-import json
+import time
+import operator
 import threading
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from lib.sd_manager import (
@@ -22,7 +22,7 @@ from lib.sd_manager import (
     unmount_partition, get_free_space, get_drive_partitions
 )
 from lib.onion_installer import (
-    fetch_releases, download_release, extract_to_sd,
+    fetch_releases, load_cached_releases, download_release, extract_to_sd,
     verify_extraction, get_required_space, get_downloaded_releases
 )
 from lib.backup_restore import (
@@ -32,7 +32,7 @@ from lib.config_manager import (
     load_config_definitions, get_current_settings, apply_settings
 )
 from lib.emulator_manager import (
-    scan_packages, install_package, uninstall_package, auto_install,
+    scan_packages_cached, install_package, uninstall_package, auto_install,
     get_package_status_color
 )
 from lib.wifi_config import (
@@ -52,10 +52,204 @@ CONFIG_PATH = APP_DIR / "config.json"
 RESOURCES_DIR = APP_DIR / "resources"
 
 BIOS_CACHE_DIR = APP_DIR / "bios_cache"
+RELEASES_CACHE_PATH = DOWNLOADS_DIR / ".releases_cache.json"
+DEPS_STAMP_PATH = APP_DIR / ".deps_ok"
+# The downloads, backups and BIOS cache directories are created on first
+# write by the lib functions that use them, so nothing is created here.
+
+ICON_PATH = next(
+    (p for p in (APP_DIR / "icon.png", RESOURCES_DIR / "onion.png") if p.exists()),
+    None,
+)
+
+REQUIRED_BIOS = tuple(e for e in BIOS_FILES if e.required)
+TOTAL_BIOS = len(BIOS_FILES)
+REQUIRED_TOTAL = len(REQUIRED_BIOS)
+
+# Every directory under BIOS_CACHE_DIR that holds BIOS files
+BIOS_CACHE_DIRS = tuple(dict.fromkeys(BIOS_CACHE_DIR / e.subdir for e in BIOS_FILES))
+
+# EmulatorDialog row colours, keyed by get_package_status_color()
+_STATUS_COLOR_HEX = {"green": "#90EE90", "orange": "#FFD700", "white": "#FFFFFF"}
+# EmulatorDialog status text, indexed by (installed << 1) | has_roms
+_PKG_STATUS_TEXT = ("Not installed", "ROMs found", "Installed", "Installed")
+
+# (key, label) of each backup category, for the Backup/Restore checkboxes
+_BACKUP_CAT_LIST = tuple((k, c['label']) for k, c in BACKUP_CATEGORIES.items())
+
+# Label templates used on status/progress refreshes
+_BIOS_STATUS_FMT = "Cached: {}/{} files ({}/{} required)".format
+_DL_FMT = "Downloading: {:.1f} / {:.1f} MB".format
+
+# All background work (SD card operations, downloads, GitHub queries) runs
+# on this pool, which keeps threads warm between operations and caps how
+# many jobs can run at once.
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="onion-io")
+# Set when the main window closes. Downloads check it between chunks so the
+# process can exit instead of waiting for them; a job already writing to
+# the card still finishes.
+_SHUTDOWN = threading.Event()
+
+
+# lsblk results are reused for a couple of seconds, so chained actions
+# (e.g. check disk, then format) don't enumerate the drives twice.
+_DRIVE_CACHE_TTL = 2.0  # seconds
+_DRIVE_CACHE = {"ts": 0.0, "drives": None}
+
+
+def _list_drives_cached():
+    """Return list_removable_drives(), reusing a result younger than the TTL."""
+    if (_DRIVE_CACHE["drives"]
+            and time.monotonic() - _DRIVE_CACHE["ts"] < _DRIVE_CACHE_TTL):
+        return _DRIVE_CACHE["drives"]
+    drives = list_removable_drives()
+    _DRIVE_CACHE["drives"] = drives
+    _DRIVE_CACHE["ts"] = time.monotonic()
+    return drives
+
+
+def _invalidate_drive_cache():
+    """Force the next drive listing to run lsblk (after format/eject)."""
+    _DRIVE_CACHE["ts"] = 0.0
+
+
+# How long the card picked for one settings/backup dialog is reused by the
+# next one without asking again.
+_MOUNT_CACHE_TTL = 30.0  # seconds
+
+
+# Saved host WiFi networks; nmcli runs once per saved connection, and the
+# list rarely changes while the app is open.
+_WIFI_CACHE_TTL = 60.0  # seconds
+_WIFI_CACHE = {"ts": 0.0, "nets": None}
+
+
+def _host_wifi_networks_cached():
+    """Return get_host_wifi_networks(), reusing a result younger than the TTL."""
+    if (_WIFI_CACHE["nets"] is not None
+            and time.monotonic() - _WIFI_CACHE["ts"] < _WIFI_CACHE_TTL):
+        return _WIFI_CACHE["nets"]
+    nets = get_host_wifi_networks()
+    _WIFI_CACHE["nets"] = nets
+    _WIFI_CACHE["ts"] = time.monotonic()
+    return nets
+
+
+# Sorted list_backups() result, valid while BACKUPS_DIR's mtime is unchanged.
+# BackupDialog resets "mtime" after a successful backup, since the new
+# directory exists before its backup_info.json is written.
+_BACKUP_CACHE = {"mtime": 0, "sorted": None}
+
+
+def _list_backups_cached():
+    """Return the backups in BACKUPS_DIR, newest first."""
+    try:
+        mtime = os.stat(BACKUPS_DIR).st_mtime_ns
+    except OSError:
+        return []
+    if _BACKUP_CACHE["sorted"] is not None and _BACKUP_CACHE["mtime"] == mtime:
+        return _BACKUP_CACHE["sorted"]
+    backups = sorted(list_backups(str(BACKUPS_DIR)),
+                     key=operator.itemgetter('date'), reverse=True)
+    _BACKUP_CACHE["mtime"] = mtime
+    _BACKUP_CACHE["sorted"] = backups
+    return backups
+
+
+def _release_list(release_data):
+    """Flatten fetch_releases() output into one list, stable releases first."""
+    return release_data.get('stable', []) + release_data.get('beta', [])
+
+
+def _bios_cache_mtimes():
+    """Return the mtimes of BIOS_CACHE_DIRS (None for a missing directory)."""
+    mtimes = []
+    for path in BIOS_CACHE_DIRS:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _list_files_async(path, callback):
+    """List the regular files in *path* without blocking the main loop.
+
+    Uses Gio's async enumerator, 64 entries per batch, and finally calls
+    ``callback(path, names)`` on the main loop; *names* is empty if the
+    directory is missing or unreadable.
+    """
+    names = set()
+
+    def on_next(enumerator, result):
+        try:
+            infos = enumerator.next_files_finish(result)
+        except GLib.Error:
+            infos = []
+        if not infos:
+            enumerator.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            callback(path, names)
+            return
+        names.update(i.get_name() for i in infos
+                     if i.get_file_type() == Gio.FileType.REGULAR)
+        enumerator.next_files_async(64, GLib.PRIORITY_DEFAULT, None, on_next)
+
+    def on_enumerate(gfile, result):
+        try:
+            enumerator = gfile.enumerate_children_finish(result)
+        except GLib.Error:
+            callback(path, names)
+            return
+        enumerator.next_files_async(64, GLib.PRIORITY_DEFAULT, None, on_next)
+
+    Gio.File.new_for_path(str(path)).enumerate_children_async(
+        "standard::name,standard::type", Gio.FileQueryInfoFlags.NONE,
+        GLib.PRIORITY_DEFAULT, None, on_enumerate,
+    )
+
+
+def _pad(widget, margin=10, vertical=None):
+    """Set *widget*'s margins and return it.
+
+    *margin* applies to all four sides through the single ``margin``
+    property, unless *vertical* gives a separate top/bottom margin.
+    """
+    if vertical is None:
+        widget.props.margin = margin
+    else:
+        widget.props.margin_start = widget.props.margin_end = margin
+        widget.props.margin_top = widget.props.margin_bottom = vertical
+    return widget
 
-DOWNLOADS_DIR.mkdir(exist_ok=True)
-BACKUPS_DIR.mkdir(exist_ok=True)
-BIOS_CACHE_DIR.mkdir(exist_ok=True)
+
+def _destroy_on_response(dialog, response):
+    """Destroy a dialog shown without a nested run() loop once it responds.
+
+    Connect it after the dialog's own ``response`` handler (the dialogs
+    connect theirs in ``__init__``) so that one sees the live widgets first.
+    """
+    dialog.destroy()
+
+
+def _parse_markup(markup):
+    """Parse constant Pango *markup* once, returning ``(text, attrs)``."""
+    _ok, attrs, text, _accel = Pango.parse_markup(markup, -1, "\0")
+    return text, attrs
+
+
+# Bold headings on the About tab. The links label keeps set_markup(), since
+# <a> tags only become clickable when GtkLabel parses them itself.
+_ABOUT_TITLE_TEXT, _ABOUT_TITLE_ATTRS = _parse_markup(f"<b>{APP_NAME}</b> v{APP_VERSION}")
+_SUPPORT_ORIG_TEXT, _SUPPORT_ORIG_ATTRS = _parse_markup("<b>Support the original developer:</b>")
+_SUPPORT_PORT_TEXT, _SUPPORT_PORT_ATTRS = _parse_markup("<b>Support the Linux port developer:</b>")
+
+# EmulatorDialog colour legend as (text, attrs) pairs
+_LEGEND_ITEMS = tuple(
+    _parse_markup(f'<span background="{_STATUS_COLOR_HEX[color]}">  </span> {desc}')
+    for color, desc in (("green", "Installed"),
+                        ("orange", "ROMs found, not installed"),
+                        ("white", "Not installed"))
+)
 
 
 class DriveSelector(Gtk.Dialog):
@@ -77,62 +271,67 @@ class DriveSelector(Gtk.Dialog):
 
         content = self.get_content_area()
         content.set_spacing(10)
-        content.set_margin_start(15)
-        content.set_margin_end(15)
-        content.set_margin_top(15)
-        content.set_margin_bottom(15)
+        _pad(content, 15)
 
         label = Gtk.Label(label="Select the SD card to use:")
         label.set_halign(Gtk.Align.START)
         content.pack_start(label, False, False, 0)
 
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_min_content_height(200)
-        content.pack_start(scrolled, True, True, 0)
+        self.scrolled = Gtk.ScrolledWindow()
+        self.scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.scrolled.set_min_content_height(200)
+        content.pack_start(self.scrolled, True, True, 0)
+
+        # ListStore: selected, display text, drive dict
+        self.store = Gtk.ListStore(bool, str, object)
+        self.treeview = Gtk.TreeView(model=self.store)
+        self.treeview.set_headers_visible(False)
+
+        toggle_renderer = Gtk.CellRendererToggle(radio=True)
+        toggle_renderer.connect("toggled", self._on_drive_toggled)
+        self.treeview.append_column(Gtk.TreeViewColumn("Select", toggle_renderer, active=0))
+        self.treeview.append_column(Gtk.TreeViewColumn("Drive", Gtk.CellRendererText(), text=1))
 
-        self.radio_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        scrolled.add(self.radio_box)
+        self.treeview.get_selection().connect("changed", self._on_selection_changed)
+        self.treeview.connect("row-activated", lambda *args: self.response(Gtk.ResponseType.OK))
 
         self._populate_drives()
         self.show_all()
 
     def _populate_drives(self):
-        drives = list_removable_drives()
+        drives = _list_drives_cached()
         if not drives:
             label = Gtk.Label(label="No removable drives detected.\nInsert an SD card and try again.")
             label.set_halign(Gtk.Align.START)
-            self.radio_box.pack_start(label, False, False, 0)
+            label.set_valign(Gtk.Align.START)
+            self.scrolled.add(label)
             return
 
-        first_radio = None
-        for drive in drives:
-            text = f"/dev/{drive['name']} - {drive['size']} - {drive.get('model', 'Unknown')}"
-            if drive.get('label'):
-                text += f" [{drive['label']}]"
-
-            if first_radio is None:
-                radio = Gtk.RadioButton.new_with_label(None, text)
-                first_radio = radio
-            else:
-                radio = Gtk.RadioButton.new_with_label_from_widget(first_radio, text)
+        for i, drive in enumerate(drives):
+            self.store.append([i == 0, drive['display'], drive])
 
-            radio.drive_info = drive
-            radio.connect("toggled", self._on_radio_toggled)
-            self.radio_box.pack_start(radio, False, False, 0)
+        self.scrolled.add(self.treeview)
+        self.treeview.get_selection().select_path(0)
 
-        if first_radio:
-            first_radio.set_active(True)
-            self.selected_drive = first_radio.drive_info
+    def _on_drive_toggled(self, renderer, path):
+        self.treeview.get_selection().select_path(path)
 
-    def _on_radio_toggled(self, button):
-        if button.get_active():
-            self.selected_drive = button.drive_info
+    def _on_selection_changed(self, selection):
+        model, treeiter = selection.get_selected()
+        if treeiter is None:
+            return
+        for row in model:
+            row[0] = False
+        model[treeiter][0] = True
+        self.selected_drive = model[treeiter][2]
 
 
 class ProgressDialog(Gtk.Dialog):
     """Progress dialog with a progress bar and status label."""
 
+    # Minimum delay between coalesced updates from post_progress().
+    FLUSH_INTERVAL_MS = 50
+
     def __init__(self, parent, title="Working..."):
         super().__init__(
             title=title,
@@ -145,10 +344,7 @@ class ProgressDialog(Gtk.Dialog):
 
         content = self.get_content_area()
         content.set_spacing(10)
-        content.set_margin_start(20)
-        content.set_margin_end(20)
-        content.set_margin_top(20)
-        content.set_margin_bottom(20)
+        _pad(content, 20)
 
         self.status_label = Gtk.Label(label="Starting...")
         self.status_label.set_halign(Gtk.Align.START)
@@ -159,34 +355,102 @@ class ProgressDialog(Gtk.Dialog):
         self.progress_bar.set_show_text(True)
         content.pack_start(self.progress_bar, False, False, 0)
 
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        self._flush_id = None
+        self._destroyed = False
+        self.connect("destroy", self._on_destroy)
+
+        # Last values pushed to the widgets, so repeats don't queue redraws
+        self._last_fraction = -1.0
+        self._last_text = None
+
         self.show_all()
 
     def set_progress(self, fraction, text=None):
+        with self._pending_lock:
+            self._pending = None  # superseded by this explicit update
         GLib.idle_add(self._update_progress, fraction, text)
 
+    def post_progress(self, fraction, text=None, *fmt_args):
+        """Queue a progress update from a worker thread.
+
+        Rapid updates are coalesced: only the most recent one is applied,
+        at most once every FLUSH_INTERVAL_MS, so chatty workers cannot
+        flood the main loop with idle callbacks.
+
+        If *fmt_args* are given, *text* is a ``str.format`` template that is
+        only filled in when the update is applied, so superseded updates
+        cost no string formatting.
+        """
+        with self._pending_lock:
+            if self._destroyed:
+                return
+            self._pending = (fraction, text, fmt_args)
+            if self._flush_id is None:
+                self._flush_id = GLib.timeout_add(self.FLUSH_INTERVAL_MS, self._flush_pending)
+
+    def _flush_pending(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+            self._flush_id = None
+        if pending:
+            fraction, text, fmt_args = pending
+            if fmt_args:
+                text = text.format(*fmt_args)
+            self._update_progress(fraction, text)
+        return False
+
+    def _on_destroy(self, widget):
+        with self._pending_lock:
+            self._destroyed = True
+            if self._flush_id is not None:
+                GLib.source_remove(self._flush_id)
+                self._flush_id = None
+
     def _update_progress(self, fraction, text):
-        self.progress_bar.set_fraction(min(fraction, 1.0))
-        if text:
+        fraction = 1.0 if fraction >= 1.0 else fraction
+        if fraction != self._last_fraction:
+            self.progress_bar.set_fraction(fraction)
+            self._last_fraction = fraction
+        if text and text != self._last_text:
             self.status_label.set_text(text)
+            self._last_text = text
         return False
 
 
 class OnionInstaller(Gtk.Window):
     """Main application window (replaces Menu.ps1)."""
 
+    # BIOS Manager and About have their own buttons, so OK is hidden there
+    NO_OK_PAGES = frozenset({4, 5})
+
     def __init__(self):
         super().__init__(title=f"{APP_NAME} v{APP_VERSION}")
         self.set_default_size(520, 380)
         self.set_resizable(False)
         self.set_position(Gtk.WindowPosition.CENTER)
 
-        icon_path = APP_DIR / "icon.png"
-        if not icon_path.exists():
-            icon_path = RESOURCES_DIR / "onion.png"
-        if icon_path.exists():
-            self.set_icon_from_file(str(icon_path))
+        if ICON_PATH:
+            self.set_icon_from_file(str(ICON_PATH))
+
+        self.connect("destroy", self._on_destroy)
+
+        # filename -> cached? for the BIOS tab; filled on first use and
+        # rescanned after each download batch or when a cache directory's
+        # mtime changes, i.e. files were added or removed outside the app.
+        self._bios_cache_state = None
+        self._bios_cache_mtimes = None
+        self._bios_scan_pending = False
+        self._bios_rescan_needed = False
+
+        # Reused by _show_message / _confirm; created on first use
+        self._info_dialog = None
+        self._confirm_dialog = None
 
-        self.connect("destroy", Gtk.main_quit)
+        # Last (device, mount_point) picked in _select_drive
+        self._cached_mount = None
+        self._cached_mount_ts = 0.0
 
         # Main vertical box
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -199,13 +463,24 @@ class OnionInstaller(Gtk.Window):
         self.notebook.set_margin_top(5)
         main_box.pack_start(self.notebook, True, True, 0)
 
-        # Build all tabs
-        self._build_install_tab()
-        self._build_config_tab()
-        self._build_backup_tab()
-        self._build_sdtools_tab()
-        self._build_bios_tab()
-        self._build_about_tab()
+        # Tabs start as empty placeholder pages; each is filled in the first
+        # time it is shown so startup only pays for the default tab.
+        self._tab_builders = [
+            ("Install / Update", self._build_install_tab),
+            ("Configuration", self._build_config_tab),
+            ("Backup / Restore", self._build_backup_tab),
+            ("SD Card Tools", self._build_sdtools_tab),
+            ("BIOS Manager", self._build_bios_tab),
+            ("About", self._build_about_tab),
+        ]
+        self._tab_built = set()
+        for label, _builder in self._tab_builders:
+            page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+            # Hand the label widget to append_page directly: with no label,
+            # GtkNotebook makes a "Page N" label that set_tab_label_text()
+            # would then have to replace with a second one.
+            self.notebook.append_page(page, Gtk.Label(label=label))
+        self._ensure_tab_built(0)
 
         # Bottom bar with OK and Eject buttons
         bottom_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -219,6 +494,7 @@ class OnionInstaller(Gtk.Window):
         self.ok_button.set_size_request(90, 32)
         self.ok_button.connect("clicked", self._on_ok_clicked)
         bottom_bar.pack_end(self.ok_button, False, False, 0)
+        self._ok_visible = True
 
         eject_button = Gtk.Button(label="Eject SD")
         eject_button.set_size_request(90, 32)
@@ -227,171 +503,92 @@ class OnionInstaller(Gtk.Window):
 
         self.notebook.connect("switch-page", self._on_tab_changed)
 
-    # ── Tab 1: Install or Update Onion ──────────────────────────
+    def _tab_frame(self, title):
+        """Return ``(box, inner)``: a padded tab page holding a titled frame.
 
-    def _build_install_tab(self):
+        Tab builders pack their controls into *inner* and add *box* to the
+        notebook page.
+        """
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
+        _pad(box, 15)
 
-        frame = Gtk.Frame(label="Install or Update Onion")
+        frame = Gtk.Frame(label=title)
         frame.set_margin_bottom(10)
         box.pack_start(frame, True, True, 0)
 
         inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        inner.set_margin_start(20)
-        inner.set_margin_end(20)
-        inner.set_margin_top(15)
-        inner.set_margin_bottom(15)
+        _pad(inner, 20, 15)
         frame.add(inner)
+        return box, inner
+
+    def _add_action_radios(self, container, attr, choices):
+        """Pack one radio group for *choices*, a list of ``(label, action)``.
+
+        The first choice starts selected, and ``self.<attr>`` always holds the
+        action of the active radio; all radios share one toggled handler.
+        """
+        setattr(self, attr, choices[0][1])
+        group = None
+        for label, action in choices:
+            radio = Gtk.RadioButton.new_with_label_from_widget(group, label)
+            group = group or radio
+            radio.connect("toggled", self._on_action_toggled, attr, action)
+            container.pack_start(radio, False, False, 0)
 
-        self.install_radios = []
-
-        r1 = Gtk.RadioButton.new_with_label(None, "Install / Upgrade / Reinstall Onion (without formatting SD card)")
-        r1.action = "install_no_format"
-        self.install_radios.append(r1)
-        inner.pack_start(r1, False, False, 0)
+    # ── Tab 1: Install or Update Onion ──────────────────────────
 
-        r2 = Gtk.RadioButton.new_with_label_from_widget(r1, "Format SD card and install Onion")
-        r2.action = "format_and_install"
-        self.install_radios.append(r2)
-        inner.pack_start(r2, False, False, 0)
+    def _build_install_tab(self, page):
+        box, inner = self._tab_frame("Install or Update Onion")
 
-        r3 = Gtk.RadioButton.new_with_label_from_widget(r1, "Migrate stock SD card to a new SD card with Onion")
-        r3.action = "migrate_stock"
-        self.install_radios.append(r3)
-        inner.pack_start(r3, False, False, 0)
+        self._add_action_radios(inner, "_install_action", [
+            ("Install / Upgrade / Reinstall Onion (without formatting SD card)", "install_no_format"),
+            ("Format SD card and install Onion", "format_and_install"),
+            ("Migrate stock SD card to a new SD card with Onion", "migrate_stock"),
+        ])
 
-        self.notebook.append_page(box, Gtk.Label(label="Install / Update"))
+        page.pack_start(box, True, True, 0)
 
     # ── Tab 2: Onion Configuration ──────────────────────────────
 
-    def _build_config_tab(self):
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
-
-        frame = Gtk.Frame(label="Onion Configuration")
-        frame.set_margin_bottom(10)
-        box.pack_start(frame, True, True, 0)
-
-        inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        inner.set_margin_start(20)
-        inner.set_margin_end(20)
-        inner.set_margin_top(15)
-        inner.set_margin_bottom(15)
-        frame.add(inner)
-
-        self.config_radios = []
+    def _build_config_tab(self, page):
+        box, inner = self._tab_frame("Onion Configuration")
 
-        r1 = Gtk.RadioButton.new_with_label(None, "Onion OS Settings")
-        r1.action = "onion_settings"
-        self.config_radios.append(r1)
-        inner.pack_start(r1, False, False, 0)
+        self._add_action_radios(inner, "_config_action", [
+            ("Onion OS Settings", "onion_settings"),
+            ("Emulators and Applications Manager", "emulator_manager"),
+            ("WiFi Configuration", "wifi_config"),
+        ])
 
-        r2 = Gtk.RadioButton.new_with_label_from_widget(r1, "Emulators and Applications Manager")
-        r2.action = "emulator_manager"
-        self.config_radios.append(r2)
-        inner.pack_start(r2, False, False, 0)
-
-        r3 = Gtk.RadioButton.new_with_label_from_widget(r1, "WiFi Configuration")
-        r3.action = "wifi_config"
-        self.config_radios.append(r3)
-        inner.pack_start(r3, False, False, 0)
-
-        self.notebook.append_page(box, Gtk.Label(label="Configuration"))
+        page.pack_start(box, True, True, 0)
 
     # ── Tab 3: Backup or Restore ────────────────────────────────
 
-    def _build_backup_tab(self):
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
-
-        frame = Gtk.Frame(label="Backup or Restore Onion")
-        frame.set_margin_bottom(10)
-        box.pack_start(frame, True, True, 0)
+    def _build_backup_tab(self, page):
+        box, inner = self._tab_frame("Backup or Restore Onion")
 
-        inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        inner.set_margin_start(20)
-        inner.set_margin_end(20)
-        inner.set_margin_top(15)
-        inner.set_margin_bottom(15)
-        frame.add(inner)
+        self._add_action_radios(inner, "_backup_action", [
+            ("Backup Onion or Stock SD card data", "backup"),
+            ("Restore a backup on Onion", "restore"),
+        ])
 
-        self.backup_radios = []
-
-        r1 = Gtk.RadioButton.new_with_label(None, "Backup Onion or Stock SD card data")
-        r1.action = "backup"
-        self.backup_radios.append(r1)
-        inner.pack_start(r1, False, False, 0)
-
-        r2 = Gtk.RadioButton.new_with_label_from_widget(r1, "Restore a backup on Onion")
-        r2.action = "restore"
-        self.backup_radios.append(r2)
-        inner.pack_start(r2, False, False, 0)
-
-        self.notebook.append_page(box, Gtk.Label(label="Backup / Restore"))
+        page.pack_start(box, True, True, 0)
 
     # ── Tab 4: SD Card Tools ────────────────────────────────────
 
-    def _build_sdtools_tab(self):
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
-
-        frame = Gtk.Frame(label="SD Card Tools")
-        frame.set_margin_bottom(10)
-        box.pack_start(frame, True, True, 0)
-
-        inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        inner.set_margin_start(20)
-        inner.set_margin_end(20)
-        inner.set_margin_top(15)
-        inner.set_margin_bottom(15)
-        frame.add(inner)
-
-        self.sdtools_radios = []
+    def _build_sdtools_tab(self, page):
+        box, inner = self._tab_frame("SD Card Tools")
 
-        r1 = Gtk.RadioButton.new_with_label(None, "Format SD card in FAT32")
-        r1.action = "format_fat32"
-        self.sdtools_radios.append(r1)
-        inner.pack_start(r1, False, False, 0)
+        self._add_action_radios(inner, "_sdtools_action", [
+            ("Format SD card in FAT32", "format_fat32"),
+            ("Check for errors (fsck)", "check_disk"),
+        ])
 
-        r2 = Gtk.RadioButton.new_with_label_from_widget(r1, "Check for errors (fsck)")
-        r2.action = "check_disk"
-        self.sdtools_radios.append(r2)
-        inner.pack_start(r2, False, False, 0)
-
-        self.notebook.append_page(box, Gtk.Label(label="SD Card Tools"))
+        page.pack_start(box, True, True, 0)
 
     # ── Tab 5: BIOS Manager ──────────────────────────────────────
 
-    def _build_bios_tab(self):
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
-
-        frame = Gtk.Frame(label="BIOS Manager")
-        frame.set_margin_bottom(10)
-        box.pack_start(frame, True, True, 0)
-
-        inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        inner.set_margin_start(20)
-        inner.set_margin_end(20)
-        inner.set_margin_top(15)
-        inner.set_margin_bottom(15)
-        frame.add(inner)
+    def _build_bios_tab(self, page):
+        box, inner = self._tab_frame("BIOS Manager")
 
         desc = Gtk.Label(
             label="Download and install BIOS files required by emulators.\n"
@@ -424,21 +621,70 @@ class OnionInstaller(Gtk.Window):
         inst_btn.connect("clicked", self._on_bios_install)
         btn_box.pack_start(inst_btn, False, False, 0)
 
-        self.notebook.append_page(box, Gtk.Label(label="BIOS Manager"))
-        GLib.idle_add(self._update_bios_status)
+        page.pack_start(box, True, True, 0)
+        self._update_bios_status()
+
+    def _get_bios_cache_state(self):
+        mtimes = _bios_cache_mtimes()
+        if self._bios_cache_state is None or mtimes != self._bios_cache_mtimes:
+            self._bios_cache_state = scan_cached_bios(BIOS_CACHE_DIR)
+            self._bios_cache_mtimes = mtimes
+        return self._bios_cache_state
+
+    def _scan_bios_cache_async(self):
+        """Rebuild _bios_cache_state off the main loop, then update the label."""
+        if self._bios_scan_pending:
+            # The running scan may predate the change; repeat it afterwards
+            self._bios_rescan_needed = True
+            return
+        self._bios_scan_pending = True
+        mtimes = _bios_cache_mtimes()
+        listings = {}
+
+        def on_listed(path, names):
+            listings[path] = names
+            if len(listings) < len(BIOS_CACHE_DIRS):
+                return
+            self._bios_cache_state = {
+                e.filename: e.filename in listings[BIOS_CACHE_DIR / e.subdir]
+                for e in BIOS_FILES
+            }
+            self._bios_cache_mtimes = mtimes
+            self._bios_scan_pending = False
+            if self._bios_rescan_needed:
+                self._bios_rescan_needed = False
+                self._scan_bios_cache_async()
+            else:
+                self._show_bios_status()
+
+        for path in BIOS_CACHE_DIRS:
+            _list_files_async(path, on_listed)
+
+    def _rescan_bios_cache(self):
+        """Rebuild the BIOS index after an operation that changed the cache.
+
+        Files may have been written, replaced or deleted (a failed download
+        removes its partial file) while the operation ran, so the recorded
+        mtimes are not trusted; the label updates once the scan finishes.
+        """
+        self._bios_cache_mtimes = None
+        self._scan_bios_cache_async()
+        return False
 
     def _update_bios_status(self):
-        cached = scan_cached_bios(BIOS_CACHE_DIR)
-        total_files = len(BIOS_FILES)
-        cached_count = sum(1 for v in cached.values() if v)
-        required_files = [e for e in BIOS_FILES if e["required"]]
-        required_total = len(required_files)
-        required_cached = sum(1 for e in required_files if cached.get(e["filename"], False))
+        if (self._bios_cache_state is None
+                or _bios_cache_mtimes() != self._bios_cache_mtimes):
+            self._scan_bios_cache_async()
+        else:
+            self._show_bios_status()
+
+    def _show_bios_status(self):
+        cached = self._bios_cache_state
+        cached_count = sum(cached.values())
+        required_cached = sum(1 for e in REQUIRED_BIOS if cached.get(e.filename))
         self.bios_status_label.set_text(
-            f"Cached: {cached_count}/{total_files} files "
-            f"({required_cached}/{required_total} required)"
+            _BIOS_STATUS_FMT(cached_count, TOTAL_BIOS, required_cached, REQUIRED_TOTAL)
         )
-        return False
 
     def _on_bios_download(self, button):
         required_only = self.bios_required_only.get_active()
@@ -446,16 +692,14 @@ class OnionInstaller(Gtk.Window):
 
         def worker():
             try:
-                def cb(fraction, text):
-                    GLib.idle_add(progress.set_progress, fraction, text)
-
                 ok, succeeded, failed = download_all_bios(
-                    BIOS_CACHE_DIR, progress_cb=cb,
+                    BIOS_CACHE_DIR, progress_cb=progress.post_progress,
                     skip_cached=True, required_only=required_only,
+                    cancel_event=_SHUTDOWN,
                 )
 
                 GLib.idle_add(progress.set_progress, 1.0, "Done!")
-                GLib.idle_add(self._update_bios_status)
+                GLib.idle_add(self._rescan_bios_cache)
 
                 if ok:
                     GLib.idle_add(
@@ -471,13 +715,11 @@ class OnionInstaller(Gtk.Window):
             except Exception as e:
                 GLib.idle_add(self._show_error_and_close_progress, progress, str(e))
 
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        self._run_in_background(worker, progress)
 
     def _on_bios_install(self, button):
         # Check that at least some files are cached
-        cached = scan_cached_bios(BIOS_CACHE_DIR)
-        if not any(cached.values()):
+        if not any(self._get_bios_cache_state().values()):
             self._show_message(
                 "No BIOS Files",
                 "No BIOS files found in cache.\nDownload them first using 'Download All to Cache'.",
@@ -497,12 +739,9 @@ class OnionInstaller(Gtk.Window):
 
         def worker():
             try:
-                def cb(fraction, text):
-                    GLib.idle_add(progress.set_progress, fraction, text)
-
                 ok, succeeded, failed = install_bios_to_sd(
                     BIOS_CACHE_DIR, Path(mount_point),
-                    progress_cb=cb, required_only=required_only,
+                    progress_cb=progress.post_progress, required_only=required_only,
                 )
 
                 GLib.idle_add(progress.set_progress, 1.0, "Done!")
@@ -521,20 +760,15 @@ class OnionInstaller(Gtk.Window):
             except Exception as e:
                 GLib.idle_add(self._show_error_and_close_progress, progress, str(e))
 
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        self._run_in_background(worker, progress)
 
     # ── Tab 6: About ────────────────────────────────────────────
 
-    def _build_about_tab(self):
+    def _build_about_tab(self, page):
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
+        _pad(box, 15)
 
-        title = Gtk.Label()
-        title.set_markup(f"<b>{APP_NAME}</b> v{APP_VERSION}")
+        title = Gtk.Label(label=_ABOUT_TITLE_TEXT, attributes=_ABOUT_TITLE_ATTRS)
         title.set_halign(Gtk.Align.START)
         box.pack_start(title, False, False, 0)
 
@@ -558,8 +792,7 @@ class OnionInstaller(Gtk.Window):
         sep2 = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
         box.pack_start(sep2, False, False, 5)
 
-        support_label = Gtk.Label()
-        support_label.set_markup("<b>Support the original developer:</b>")
+        support_label = Gtk.Label(label=_SUPPORT_ORIG_TEXT, attributes=_SUPPORT_ORIG_ATTRS)
         support_label.set_halign(Gtk.Align.START)
         box.pack_start(support_label, False, False, 0)
 
@@ -576,8 +809,7 @@ class OnionInstaller(Gtk.Window):
         sep3 = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
         box.pack_start(sep3, False, False, 5)
 
-        port_label = Gtk.Label()
-        port_label.set_markup("<b>Support the Linux port developer:</b>")
+        port_label = Gtk.Label(label=_SUPPORT_PORT_TEXT, attributes=_SUPPORT_PORT_ATTRS)
         port_label.set_halign(Gtk.Align.START)
         box.pack_start(port_label, False, False, 0)
 
@@ -586,13 +818,32 @@ class OnionInstaller(Gtk.Window):
         port_link_box.pack_start(btn, False, False, 0)
         box.pack_start(port_link_box, False, False, 0)
 
-        self.notebook.append_page(box, Gtk.Label(label="About"))
+        page.pack_start(box, True, True, 0)
 
     # ── Event Handlers ──────────────────────────────────────────
 
+    def _on_action_toggled(self, button, attr, action):
+        if button.get_active():
+            setattr(self, attr, action)
+
+    def _ensure_tab_built(self, page_num):
+        if page_num in self._tab_built:
+            return
+        page = self.notebook.get_nth_page(page_num)
+        self._tab_builders[page_num][1](page)
+        page.show_all()
+        self._tab_built.add(page_num)
+
     def _on_tab_changed(self, notebook, page, page_num):
-        # Hide OK button on BIOS tab (has its own buttons) and About tab
-        self.ok_button.set_visible(page_num not in (4, 5))
+        if page_num == 4 and page_num in self._tab_built:
+            # Only a couple of stat calls unless the cache changed on disk
+            self._update_bios_status()
+        self._ensure_tab_built(page_num)
+        # Only touch the button when its visibility actually changes
+        visible = page_num not in self.NO_OK_PAGES
+        if visible != self._ok_visible:
+            self.ok_button.set_visible(visible)
+            self._ok_visible = visible
 
     def _on_ok_clicked(self, button):
         page = self.notebook.get_current_page()
@@ -616,6 +867,8 @@ class OnionInstaller(Gtk.Window):
 
         device = f"/dev/{drive['name']}"
         success, msg = eject_drive(device)
+        _invalidate_drive_cache()
+        self._forget_selected_mount()
         self._show_message(
             "Eject SD Card",
             msg,
@@ -624,14 +877,19 @@ class OnionInstaller(Gtk.Window):
 
     # ── Install/Update Actions ──────────────────────────────────
 
-    def _get_selected_radio(self, radios):
-        for r in radios:
-            if r.get_active():
-                return r.action
-        return None
+    def _select_drive(self, reuse=False):
+        """Show drive selector and return (device, mount_point) or (None, None).
+
+        With *reuse*, a card picked less than _MOUNT_CACHE_TTL seconds ago
+        that is still mounted is returned without asking again. Flows that
+        format the card or need two different cards leave it off.
+        """
+        if (reuse and self._cached_mount
+                and time.monotonic() - self._cached_mount_ts < _MOUNT_CACHE_TTL
+                and os.path.ismount(self._cached_mount[1])):
+            return self._cached_mount
+        self._forget_selected_mount()
 
-    def _select_drive(self):
-        """Show drive selector and return (device, mount_point) or (None, None)."""
         dialog = DriveSelector(self)
         response = dialog.run()
         drive = dialog.selected_drive
@@ -647,11 +905,18 @@ class OnionInstaller(Gtk.Window):
             mount_point = partitions[0].get('mountpoint')
             if not mount_point:
                 mount_point = mount_partition(part_dev)
+            if mount_point:
+                self._cached_mount = (device, mount_point)
+                self._cached_mount_ts = time.monotonic()
             return device, mount_point
         return device, None
 
+    def _forget_selected_mount(self):
+        """Make the next _select_drive(reuse=True) ask for a card again."""
+        self._cached_mount = None
+
     def _handle_install_action(self):
-        action = self._get_selected_radio(self.install_radios)
+        action = self._install_action
         if action == "install_no_format":
             self._do_install(format_first=False)
         elif action == "format_and_install":
@@ -671,6 +936,7 @@ class OnionInstaller(Gtk.Window):
             )
             if not confirm:
                 return
+            self._forget_selected_mount()
 
         # Show release picker
         release_dialog = ReleasePicker(self)
@@ -687,72 +953,105 @@ class OnionInstaller(Gtk.Window):
                 if format_first:
                     GLib.idle_add(progress.set_progress, 0.05, "Formatting SD card...")
                     success, msg = format_sd_card(device)
+                    _invalidate_drive_cache()
                     if not success:
                         GLib.idle_add(self._show_error_and_close_progress, progress, f"Format failed: {msg}")
                         return
-                    # Re-mount after format — give the kernel time to settle
-                    import time
+                    # Re-mount after format — give the kernel time to settle.
+                    # The wait runs on a GLib timer so this pool worker is
+                    # released instead of sleeping.
                     GLib.idle_add(progress.set_progress, 0.08, "Waiting for drive to settle...")
-                    time.sleep(3)
-                    nonlocal mount_point
-                    mount_point = None
-                    dev_name = device.replace('/dev/', '')
-                    for attempt in range(5):
-                        partitions = get_drive_partitions(dev_name)
-                        if partitions:
-                            part_dev = f"/dev/{partitions[0]['name']}"
-                            mount_point = mount_partition(part_dev)
-                            if mount_point:
-                                break
-                        time.sleep(2)
+                    GLib.timeout_add_seconds(3, self._wait_for_mount, device, release, progress)
+                    return
 
                 if not mount_point:
                     GLib.idle_add(self._show_error_and_close_progress, progress, "Could not mount SD card.")
                     return
 
-                # Download if needed
-                zip_path = None
-                if release.get('local_path'):
-                    zip_path = release['local_path']
-                else:
-                    GLib.idle_add(progress.set_progress, 0.1, "Downloading Onion OS...")
-                    def dl_progress(downloaded, total):
-                        if total > 0:
-                            frac = 0.1 + 0.5 * (downloaded / total)
-                            size_mb = downloaded / (1024 * 1024)
-                            total_mb = total / (1024 * 1024)
-                            GLib.idle_add(progress.set_progress, frac, f"Downloading: {size_mb:.1f} / {total_mb:.1f} MB")
-                    zip_path = download_release(release['url'], str(DOWNLOADS_DIR), dl_progress)
-
-                # Extract
-                GLib.idle_add(progress.set_progress, 0.6, "Extracting Onion OS to SD card...")
-                def ext_progress(current_file, idx, total):
-                    frac = 0.6 + 0.35 * (idx / max(total, 1))
-                    GLib.idle_add(progress.set_progress, frac, f"Extracting: {current_file}")
-
-                success, msg = extract_to_sd(zip_path, mount_point, ext_progress)
-                if not success:
-                    GLib.idle_add(self._show_error_and_close_progress, progress, f"Extract failed: {msg}")
-                    return
-
-                # Verify
-                GLib.idle_add(progress.set_progress, 0.97, "Verifying installation...")
-                success, missing = verify_extraction(mount_point)
-
-                GLib.idle_add(progress.set_progress, 1.0, "Done!")
-                if success:
-                    GLib.idle_add(self._show_success_and_close_progress, progress,
-                                  "Onion OS installed successfully!\n\nYou can now eject the SD card and insert it into your Miyoo Mini.")
-                else:
-                    GLib.idle_add(self._show_error_and_close_progress, progress,
-                                  f"Installation completed but some directories are missing:\n{', '.join(missing)}")
-
+                self._install_release(mount_point, release, progress)
             except Exception as e:
                 GLib.idle_add(self._show_error_and_close_progress, progress, str(e))
 
         progress = ProgressDialog(self, "Installing Onion OS")
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        self._run_in_background(worker, progress)
+
+    def _wait_for_mount(self, device, release, progress, attempt=0):
+        """Try to mount a freshly formatted *device*, then continue the install.
+
+        Each attempt runs on the I/O pool; a failed attempt re-arms a 2 second
+        timer, up to 5 attempts in total.
+        """
+        def probe():
+            mount_point = None
+            partitions = get_drive_partitions(device.replace('/dev/', ''))
+            if partitions:
+                mount_point = mount_partition(f"/dev/{partitions[0]['name']}")
+
+            if mount_point:
+                self._install_release(mount_point, release, progress)
+            elif attempt + 1 < 5:
+                GLib.timeout_add_seconds(2, self._wait_for_mount, device, release, progress, attempt + 1)
+            else:
+                GLib.idle_add(self._show_error_and_close_progress, progress, "Could not mount SD card.")
+
+        self._run_in_background(probe, progress)
+        return False
+
+    def _install_release(self, mount_point, release, progress):
+        """Download (if needed), extract and verify *release* on *mount_point*.
+
+        Runs on a pool worker.
+        """
+        try:
+            # Download if needed
+            zip_path = None
+            if release.get('local_path'):
+                zip_path = release['local_path']
+            else:
+                GLib.idle_add(progress.set_progress, 0.1, "Downloading Onion OS...")
+                # Only report every ~1% (at least 512 KiB) of the download
+                next_emit = 0
+                step = total_mb = None
+                def dl_progress(downloaded, total):
+                    nonlocal next_emit, step, total_mb
+                    if total <= 0 or (downloaded < next_emit and downloaded < total):
+                        return
+                    if step is None:
+                        step = max(total // 100, 512 * 1024)
+                        total_mb = total / (1024 * 1024)
+                    next_emit = downloaded + step
+                    frac = 0.1 + 0.5 * (downloaded / total)
+                    size_mb = downloaded / (1024 * 1024)
+                    GLib.idle_add(progress.set_progress, frac, _DL_FMT(size_mb, total_mb))
+                zip_path = download_release(
+                    release['url'], str(DOWNLOADS_DIR), dl_progress, cancel_event=_SHUTDOWN
+                )
+
+            # Extract
+            GLib.idle_add(progress.set_progress, 0.6, "Extracting Onion OS to SD card...")
+            def ext_progress(current_file, idx, total):
+                frac = 0.6 + 0.35 * (idx / max(total, 1))
+                GLib.idle_add(progress.set_progress, frac, f"Extracting: {current_file}")
+
+            success, msg = extract_to_sd(zip_path, mount_point, ext_progress)
+            if not success:
+                GLib.idle_add(self._show_error_and_close_progress, progress, f"Extract failed: {msg}")
+                return
+
+            # Verify
+            GLib.idle_add(progress.set_progress, 0.97, "Verifying installation...")
+            success, missing = verify_extraction(mount_point)
+
+            GLib.idle_add(progress.set_progress, 1.0, "Done!")
+            if success:
+                GLib.idle_add(self._show_success_and_close_progress, progress,
+                              "Onion OS installed successfully!\n\nYou can now eject the SD card and insert it into your Miyoo Mini.")
+            else:
+                GLib.idle_add(self._show_error_and_close_progress, progress,
+                              f"Installation completed but some directories are missing:\n{', '.join(missing)}")
+
+        except Exception as e:
+            GLib.idle_add(self._show_error_and_close_progress, progress, str(e))
 
     def _do_migrate(self):
         self._show_message("Migrate", "Step 1: Select the SOURCE (stock) SD card.", Gtk.MessageType.INFO)
@@ -773,7 +1072,7 @@ class OnionInstaller(Gtk.Window):
     # ── Configuration Actions ───────────────────────────────────
 
     def _handle_config_action(self):
-        action = self._get_selected_radio(self.config_radios)
+        action = self._config_action
         if action == "onion_settings":
             self._show_settings_dialog()
         elif action == "emulator_manager":
@@ -782,7 +1081,7 @@ class OnionInstaller(Gtk.Window):
             self._show_wifi_dialog()
 
     def _show_settings_dialog(self):
-        device, mount_point = self._select_drive()
+        device, mount_point = self._select_drive(reuse=True)
         if not mount_point:
             if device:
                 self._show_message("Error", "Could not mount SD card.", Gtk.MessageType.ERROR)
@@ -793,67 +1092,81 @@ class OnionInstaller(Gtk.Window):
             self._show_message("Error", "This SD card does not appear to have Onion OS installed.", Gtk.MessageType.ERROR)
             return
 
-        dialog = SettingsDialog(self, mount_point)
-        dialog.run()
-        dialog.destroy()
+        # Read config.json and the card's current settings off the main loop,
+        # then open the dialog with the data in hand.
+        def load():
+            config = load_config_definitions(str(CONFIG_PATH))
+            return config, get_current_settings(mount_point, config=config)
+
+        def on_loaded(future):
+            try:
+                config, current = future.result()
+            except Exception as e:
+                GLib.idle_add(self._show_message, "Error",
+                              f"Could not read settings: {e}", Gtk.MessageType.ERROR)
+                return
+            GLib.idle_add(self._open_settings_dialog, mount_point, config, current)
+
+        _IO_POOL.submit(load).add_done_callback(on_loaded)
+
+    def _open_settings_dialog(self, mount_point, config, current):
+        dialog = SettingsDialog(self, mount_point, config, current)
+        dialog.connect("response", _destroy_on_response)
+        return False
 
     def _show_emulator_dialog(self):
-        device, mount_point = self._select_drive()
+        device, mount_point = self._select_drive(reuse=True)
         if not mount_point:
             if device:
                 self._show_message("Error", "Could not mount SD card.", Gtk.MessageType.ERROR)
             return
 
         dialog = EmulatorDialog(self, mount_point)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect("response", _destroy_on_response)
 
     def _show_wifi_dialog(self):
-        device, mount_point = self._select_drive()
+        device, mount_point = self._select_drive(reuse=True)
         if not mount_point:
             if device:
                 self._show_message("Error", "Could not mount SD card.", Gtk.MessageType.ERROR)
             return
 
         dialog = WiFiDialog(self, mount_point)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect("response", _destroy_on_response)
 
     # ── Backup/Restore Actions ──────────────────────────────────
 
     def _handle_backup_action(self):
-        action = self._get_selected_radio(self.backup_radios)
+        action = self._backup_action
         if action == "backup":
             self._show_backup_dialog()
         elif action == "restore":
             self._show_restore_dialog()
 
     def _show_backup_dialog(self):
-        device, mount_point = self._select_drive()
+        device, mount_point = self._select_drive(reuse=True)
         if not mount_point:
             if device:
                 self._show_message("Error", "Could not mount SD card.", Gtk.MessageType.ERROR)
             return
 
         dialog = BackupDialog(self, mount_point)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect("response", _destroy_on_response)
 
     def _show_restore_dialog(self):
-        device, mount_point = self._select_drive()
+        device, mount_point = self._select_drive(reuse=True)
         if not mount_point:
             if device:
                 self._show_message("Error", "Could not mount SD card.", Gtk.MessageType.ERROR)
             return
 
         dialog = RestoreDialog(self, mount_point)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect("response", _destroy_on_response)
 
     # ── SD Card Tools Actions ───────────────────────────────────
 
     def _handle_sdtools_action(self):
-        action = self._get_selected_radio(self.sdtools_radios)
+        action = self._sdtools_action
         if action == "format_fat32":
             self._do_format()
         elif action == "check_disk":
@@ -875,20 +1188,21 @@ class OnionInstaller(Gtk.Window):
         )
         if not confirm:
             return
+        self._forget_selected_mount()
 
         progress = ProgressDialog(self, "Formatting SD Card")
 
         def worker():
             GLib.idle_add(progress.set_progress, 0.2, f"Formatting {device}...")
             success, msg = format_sd_card(device)
+            _invalidate_drive_cache()
             GLib.idle_add(progress.set_progress, 1.0, "Done!")
             if success:
                 GLib.idle_add(self._show_success_and_close_progress, progress, msg)
             else:
                 GLib.idle_add(self._show_error_and_close_progress, progress, msg)
 
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        self._run_in_background(worker, progress)
 
     def _do_check_disk(self):
         dialog = DriveSelector(self)
@@ -906,36 +1220,64 @@ class OnionInstaller(Gtk.Window):
             return
 
         part_dev = f"/dev/{partitions[0]['name']}"
+        self._forget_selected_mount()
         result = check_disk(part_dev)
         self._show_message("Disk Check Results", result, Gtk.MessageType.INFO)
 
     # ── Helper Methods ──────────────────────────────────────────
 
-    def _show_message(self, title, message, msg_type=Gtk.MessageType.INFO):
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            modal=True,
-            message_type=msg_type,
-            buttons=Gtk.ButtonsType.OK,
-            text=title,
-        )
+    def _run_shared_dialog(self, attr, buttons, msg_type, title, message):
+        """Run the reusable message dialog kept in ``self.<attr>``.
+
+        The dialog is created on first use and hidden (not destroyed)
+        afterwards. If it is already on screen, a throwaway one is used.
+        """
+        dialog = getattr(self, attr)
+        if dialog is None or dialog.get_visible():
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                modal=True,
+                buttons=buttons,
+            )
+            if getattr(self, attr) is None:
+                setattr(self, attr, dialog)
+        dialog.props.message_type = msg_type
+        dialog.props.text = title
         dialog.format_secondary_text(message)
-        dialog.run()
-        dialog.destroy()
+        response = dialog.run()
+        if dialog is getattr(self, attr):
+            dialog.hide()
+        else:
+            dialog.destroy()
+        return response
+
+    def _show_message(self, title, message, msg_type=Gtk.MessageType.INFO):
+        self._run_shared_dialog("_info_dialog", Gtk.ButtonsType.OK, msg_type, title, message)
 
     def _confirm(self, title, message):
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            modal=True,
-            message_type=Gtk.MessageType.WARNING,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text=title,
+        response = self._run_shared_dialog(
+            "_confirm_dialog", Gtk.ButtonsType.YES_NO, Gtk.MessageType.WARNING, title, message
         )
-        dialog.format_secondary_text(message)
-        response = dialog.run()
-        dialog.destroy()
         return response == Gtk.ResponseType.YES
 
+    def _on_destroy(self, window):
+        # Stop in-flight downloads and drop queued jobs before leaving the
+        # main loop; the pool's threads are joined at interpreter exit.
+        _SHUTDOWN.set()
+        _IO_POOL.shutdown(wait=False, cancel_futures=True)
+        Gtk.main_quit()
+
+    def _run_in_background(self, worker, progress):
+        """Run *worker* on the I/O pool, reporting any uncaught error."""
+        def on_done(future):
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                GLib.idle_add(self._show_error_and_close_progress, progress, str(error))
+
+        _IO_POOL.submit(worker).add_done_callback(on_done)
+
     def _show_error_and_close_progress(self, progress, message):
         progress.destroy()
         self._show_message("Error", message, Gtk.MessageType.ERROR)
@@ -965,45 +1307,40 @@ class ReleasePicker(Gtk.Dialog):
 
         content = self.get_content_area()
         content.set_spacing(10)
-        content.set_margin_start(15)
-        content.set_margin_end(15)
-        content.set_margin_top(15)
-        content.set_margin_bottom(15)
+        _pad(content, 15)
 
         # Already downloaded section
         downloaded = get_downloaded_releases(str(DOWNLOADS_DIR))
         if downloaded:
             local_frame = Gtk.Frame(label="Already Downloaded")
             local_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-            local_box.set_margin_start(10)
-            local_box.set_margin_end(10)
-            local_box.set_margin_top(10)
-            local_box.set_margin_bottom(10)
+            _pad(local_box, 10)
             local_frame.add(local_box)
             content.pack_start(local_frame, False, False, 0)
 
             self.first_radio = None
+            self.first_release = None
             for dl in downloaded:
                 size_mb = dl['size'] / (1024 * 1024)
                 text = f"{dl['filename']} ({size_mb:.1f} MB)"
+                release_info = {'local_path': dl['path'], 'name': dl['filename']}
                 if self.first_radio is None:
                     radio = Gtk.RadioButton.new_with_label(None, text)
                     self.first_radio = radio
+                    self.first_release = release_info
+                    self.selected_release = release_info
                 else:
                     radio = Gtk.RadioButton.new_with_label_from_widget(self.first_radio, text)
-                radio.release_info = {'local_path': dl['path'], 'name': dl['filename']}
-                radio.connect("toggled", self._on_release_toggled)
+                radio.connect("toggled", self._on_release_toggled, release_info)
                 local_box.pack_start(radio, False, False, 0)
         else:
             self.first_radio = None
+            self.first_release = None
 
         # Online releases section
         online_frame = Gtk.Frame(label="Download from GitHub")
         online_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        online_box.set_margin_start(10)
-        online_box.set_margin_end(10)
-        online_box.set_margin_top(10)
-        online_box.set_margin_bottom(10)
+        _pad(online_box, 10)
         online_frame.add(online_box)
         content.pack_start(online_frame, True, True, 0)
 
@@ -1012,62 +1349,97 @@ class ReleasePicker(Gtk.Dialog):
 
         self.online_box = online_box
         self.loading_label = loading_label
+        # Widgets added by _populate_releases, replaced if the list changes
+        self._online_widgets = []
 
         # Fetch releases in background
-        thread = threading.Thread(target=self._fetch_releases, daemon=True)
-        thread.start()
+        _IO_POOL.submit(self._fetch_releases)
 
         self.show_all()
 
     def _fetch_releases(self):
+        # Show the cached list right away, then revalidate it with GitHub
+        # and redraw only if the answer differs.
+        cached = load_cached_releases(RELEASES_CACHE_PATH)
+        if cached is not None:
+            GLib.idle_add(self._populate_releases, _release_list(cached))
         try:
-            release_data = fetch_releases()
-            # Combine stable and beta into a flat list, stable first
-            releases = release_data.get('stable', []) + release_data.get('beta', [])
-            GLib.idle_add(self._populate_releases, releases)
+            release_data = fetch_releases(RELEASES_CACHE_PATH)
         except Exception as e:
-            GLib.idle_add(self._show_fetch_error, str(e))
+            if cached is None:
+                GLib.idle_add(self._show_fetch_error, str(e))
+            return
+        if release_data != cached:
+            GLib.idle_add(self._populate_releases, _release_list(release_data))
 
     def _populate_releases(self, releases):
-        self.loading_label.destroy()
+        if self.loading_label is not None:
+            self.loading_label.destroy()
+            self.loading_label = None
+
+        # Drop a list shown earlier, remembering which online release was picked
+        selected_url = self.selected_release.get('url') if self.selected_release else None
+        if self.first_radio in self._online_widgets:
+            self.first_radio = None
+            self.first_release = None
+        for widget in self._online_widgets:
+            widget.destroy()
+        self._online_widgets = []
+
         if not releases:
             label = Gtk.Label(label="No releases found.")
             self.online_box.pack_start(label, False, False, 0)
+            self._online_widgets.append(label)
             label.show()
-            return
+            releases = []
 
+        # Add every radio before showing any, so the box is laid out once
+        self.online_box.freeze_child_notify()
+        match = None
         for rel in releases[:10]:
             size_mb = rel.get('size', 0) / (1024 * 1024)
             pre = " [BETA]" if rel.get('prerelease') else ""
             text = f"{rel['name']}{pre} ({size_mb:.1f} MB)"
 
+            release_info = {'url': rel['browser_download_url'], 'name': rel['name']}
             if self.first_radio is None:
                 radio = Gtk.RadioButton.new_with_label(None, text)
                 self.first_radio = radio
+                self.first_release = release_info
+                self.selected_release = release_info
             else:
                 radio = Gtk.RadioButton.new_with_label_from_widget(self.first_radio, text)
+            if release_info['url'] == selected_url:
+                match = radio
 
-            radio.release_info = {'url': rel['browser_download_url'], 'name': rel['name']}
-            radio.connect("toggled", self._on_release_toggled)
+            radio.connect("toggled", self._on_release_toggled, release_info)
             self.online_box.pack_start(radio, False, False, 0)
-            radio.show()
-
-        if self.first_radio:
-            self.first_radio.set_active(True)
-            self.selected_release = self.first_radio.release_info
+            self._online_widgets.append(radio)
+        self.online_box.thaw_child_notify()
+        self.online_box.show_all()
+
+        # Keep the user's pick across a redraw, or fall back to the first entry
+        if selected_url is not None:
+            if match is not None:
+                match.set_active(True)
+            elif self.first_radio is not None:
+                self.first_radio.set_active(True)
+                self.selected_release = self.first_release
+            else:
+                self.selected_release = None
 
     def _show_fetch_error(self, error):
         self.loading_label.set_text(f"Failed to fetch releases: {error}")
 
-    def _on_release_toggled(self, button):
+    def _on_release_toggled(self, button, release_info):
         if button.get_active():
-            self.selected_release = button.release_info
+            self.selected_release = release_info
 
 
 class SettingsDialog(Gtk.Dialog):
     """Onion OS settings configurator (replaces Onion_Config_00_settings.ps1)."""
 
-    def __init__(self, parent, mount_point):
+    def __init__(self, parent, mount_point, config=None, current=None):
         super().__init__(
             title="Onion OS Settings",
             transient_for=parent,
@@ -1084,8 +1456,16 @@ class SettingsDialog(Gtk.Dialog):
         content = self.get_content_area()
         content.set_spacing(5)
 
-        config = load_config_definitions(str(CONFIG_PATH))
-        current = get_current_settings(mount_point)
+        # config / current may be preloaded by the caller off the main loop
+        if config is None:
+            config = load_config_definitions(str(CONFIG_PATH))
+        if current is None:
+            current = get_current_settings(mount_point, config=config)
+        self._current_settings = current
+
+        # Each section's checkboxes are only created when its page is first
+        # shown; unbuilt pages keep their options until then.
+        self._deferred_pages = {}
 
         notebook = Gtk.Notebook()
         content.pack_start(notebook, True, True, 0)
@@ -1095,31 +1475,42 @@ class SettingsDialog(Gtk.Dialog):
             scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
             box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-            box.set_margin_start(15)
-            box.set_margin_end(15)
-            box.set_margin_top(10)
-            box.set_margin_bottom(10)
+            _pad(box, 15, 10)
             scrolled.add(box)
 
-            for opt in options:
-                filename = opt['filename']
-                is_sub = opt.get('sub_option', 0) == 1
-
-                cb = Gtk.CheckButton(label=opt['short_description'])
-                cb.set_active(current.get(filename, False))
-                cb.set_tooltip_text(opt['description'])
-                if is_sub:
-                    cb.set_margin_start(30)
-                box.pack_start(cb, False, False, 0)
-                self.checkboxes[filename] = cb
-
+            self._deferred_pages[scrolled] = (box, options)
             notebook.append_page(scrolled, Gtk.Label(label=section_name))
 
+        first_page = notebook.get_nth_page(0)
+        if first_page is not None:
+            self._build_page(first_page)
+        notebook.connect("switch-page", self._on_switch_page)
+
         self.connect("response", self._on_response)
         self.show_all()
 
+    def _build_page(self, page):
+        box, options = self._deferred_pages.pop(page)
+        for opt in options:
+            filename = opt['filename']
+            is_sub = opt.get('sub_option', 0) == 1
+
+            cb = Gtk.CheckButton(label=opt['short_description'])
+            cb.set_active(self._current_settings.get(filename, False))
+            cb.set_tooltip_text(opt['description'])
+            if is_sub:
+                cb.set_margin_start(30)
+            box.pack_start(cb, False, False, 0)
+            self.checkboxes[filename] = cb
+        box.show_all()
+
+    def _on_switch_page(self, notebook, page, page_num):
+        if page in self._deferred_pages:
+            self._build_page(page)
+
     def _on_response(self, dialog, response):
         if response == Gtk.ResponseType.APPLY:
+            # Only pages the user opened have checkboxes; the rest are unchanged
             settings = {fn: cb.get_active() for fn, cb in self.checkboxes.items()}
             apply_settings(self.mount_point, settings)
 
@@ -1165,9 +1556,8 @@ class EmulatorDialog(Gtk.Dialog):
         legend_box.set_margin_end(10)
         content.pack_start(legend_box, False, False, 0)
 
-        for color, desc in [("#90EE90", "Installed"), ("#FFD700", "ROMs found, not installed"), ("#FFFFFF", "Not installed")]:
-            lbl = Gtk.Label()
-            lbl.set_markup(f'<span background="{color}">  </span> {desc}')
+        for text, attrs in _LEGEND_ITEMS:
+            lbl = Gtk.Label(label=text, attributes=attrs)
             legend_box.pack_start(lbl, False, False, 0)
 
         # TreeView (DataGridView equivalent)
@@ -1178,8 +1568,8 @@ class EmulatorDialog(Gtk.Dialog):
         scrolled.set_margin_bottom(10)
         content.pack_start(scrolled, True, True, 0)
 
-        # ListStore: selected, name, type, status, color, package_data_json
-        self.store = Gtk.ListStore(bool, str, str, str, str, str)
+        # ListStore: selected, name, type, status, color, package dict
+        self.store = Gtk.ListStore(bool, str, str, str, str, object)
         self.treeview = Gtk.TreeView(model=self.store)
 
         # Checkbox column
@@ -1200,23 +1590,25 @@ class EmulatorDialog(Gtk.Dialog):
         self.show_all()
 
     def _refresh_packages(self):
+        packages = scan_packages_cached(self.mount_point)
+
+        # Detach the model while refilling it so the view doesn't react row by row
+        self.treeview.set_model(None)
         self.store.clear()
-        packages = scan_packages(self.mount_point)
+        columns = list(range(self.store.get_n_columns()))
         for pkg in packages:
-            status = "Installed" if pkg['installed'] else ("ROMs found" if pkg['has_roms'] else "Not installed")
-            color = get_package_status_color(pkg)
-            color_hex = {"green": "#90EE90", "orange": "#FFD700", "white": "#FFFFFF"}.get(color, "#FFFFFF")
-            self.store.append([False, pkg['name'], pkg['type'], status, color_hex, json.dumps(pkg)])
+            status = _PKG_STATUS_TEXT[(bool(pkg['installed']) << 1) | bool(pkg['has_roms'])]
+            color_hex = _STATUS_COLOR_HEX.get(get_package_status_color(pkg), "#FFFFFF")
+            self.store.insert_with_valuesv(
+                -1, columns, [False, pkg['name'], pkg['type'], status, color_hex, pkg]
+            )
+        self.treeview.set_model(self.store)
 
     def _on_toggle(self, renderer, path):
         self.store[path][0] = not self.store[path][0]
 
     def _get_selected_packages(self):
-        selected = []
-        for row in self.store:
-            if row[0]:
-                selected.append(json.loads(row[5]))
-        return selected
+        return [row[5] for row in self.store if row[0]]
 
     def _on_install(self, button):
         selected = self._get_selected_packages()
@@ -1267,27 +1659,20 @@ class WiFiDialog(Gtk.Dialog):
 
         content = self.get_content_area()
         content.set_spacing(10)
-        content.set_margin_start(15)
-        content.set_margin_end(15)
-        content.set_margin_top(15)
-        content.set_margin_bottom(15)
+        _pad(content, 15)
 
         # Host WiFi networks
         host_frame = Gtk.Frame(label="Copy from this PC")
         host_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        host_box.set_margin_start(10)
-        host_box.set_margin_end(10)
-        host_box.set_margin_top(5)
-        host_box.set_margin_bottom(5)
+        _pad(host_box, 10, 5)
         host_frame.add(host_box)
         content.pack_start(host_frame, False, False, 0)
 
-        networks = get_host_wifi_networks()
+        networks = _host_wifi_networks_cached()
         if networks:
             for net in networks[:5]:
                 btn = Gtk.Button(label=f"Use: {net['ssid']}")
-                btn.network = net
-                btn.connect("clicked", self._on_use_network)
+                btn.connect("clicked", self._on_use_network, net)
                 host_box.pack_start(btn, False, False, 0)
         else:
             host_box.pack_start(Gtk.Label(label="No saved WiFi networks found on this PC."), False, False, 0)
@@ -1297,10 +1682,7 @@ class WiFiDialog(Gtk.Dialog):
         grid = Gtk.Grid()
         grid.set_column_spacing(10)
         grid.set_row_spacing(8)
-        grid.set_margin_start(10)
-        grid.set_margin_end(10)
-        grid.set_margin_top(10)
-        grid.set_margin_bottom(10)
+        _pad(grid, 10)
         manual_frame.add(grid)
         content.pack_start(manual_frame, False, False, 0)
 
@@ -1329,9 +1711,9 @@ class WiFiDialog(Gtk.Dialog):
         self.connect("response", self._on_response)
         self.show_all()
 
-    def _on_use_network(self, button):
-        self.ssid_entry.set_text(button.network['ssid'])
-        self.password_entry.set_text(button.network.get('password', ''))
+    def _on_use_network(self, button, network):
+        self.ssid_entry.set_text(network['ssid'])
+        self.password_entry.set_text(network.get('password', ''))
 
     def _on_response(self, dialog, response):
         if response == Gtk.ResponseType.APPLY:
@@ -1370,10 +1752,7 @@ class BackupDialog(Gtk.Dialog):
 
         content = self.get_content_area()
         content.set_spacing(10)
-        content.set_margin_start(15)
-        content.set_margin_end(15)
-        content.set_margin_top(15)
-        content.set_margin_bottom(15)
+        _pad(content, 15)
 
         state = detect_sd_state(mount_point)
         version = get_onion_version(mount_point) or "unknown"
@@ -1384,16 +1763,13 @@ class BackupDialog(Gtk.Dialog):
 
         frame = Gtk.Frame(label="Select data to backup")
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        box.set_margin_top(10)
-        box.set_margin_bottom(10)
+        _pad(box, 15, 10)
         frame.add(box)
         content.pack_start(frame, False, False, 0)
 
         self.category_checks = {}
-        for key, cat in BACKUP_CATEGORIES.items():
-            cb = Gtk.CheckButton(label=cat['label'])
+        for key, label in _BACKUP_CAT_LIST:
+            cb = Gtk.CheckButton(label=label)
             cb.set_active(True)
             self.category_checks[key] = cb
             box.pack_start(cb, False, False, 0)
@@ -1421,20 +1797,20 @@ class BackupDialog(Gtk.Dialog):
             def worker():
                 def cb(cat, current_file, done, total):
                     frac = done / max(total, 1)
-                    GLib.idle_add(progress.set_progress, frac, f"[{cat}] {current_file}")
+                    progress.post_progress(frac, "[{}] {}", cat, current_file)
 
                 success, backup_path, msg = create_backup(
                     self.mount_point, str(BACKUPS_DIR), categories, description, cb
                 )
                 GLib.idle_add(progress.set_progress, 1.0, "Done!")
                 if success:
+                    _BACKUP_CACHE["mtime"] = 0
                     GLib.idle_add(self.parent_window._show_success_and_close_progress, progress,
                                   f"Backup completed!\nSaved to: {backup_path}")
                 else:
                     GLib.idle_add(self.parent_window._show_error_and_close_progress, progress, msg)
 
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
+            self.parent_window._run_in_background(worker, progress)
 
 
 class RestoreDialog(Gtk.Dialog):
@@ -1457,10 +1833,7 @@ class RestoreDialog(Gtk.Dialog):
 
         content = self.get_content_area()
         content.set_spacing(10)
-        content.set_margin_start(15)
-        content.set_margin_end(15)
-        content.set_margin_top(15)
-        content.set_margin_bottom(15)
+        _pad(content, 15)
 
         # Backup list
         frame = Gtk.Frame(label="Select backup to restore")
@@ -1471,16 +1844,13 @@ class RestoreDialog(Gtk.Dialog):
         content.pack_start(frame, True, True, 0)
 
         backup_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        backup_box.set_margin_start(10)
-        backup_box.set_margin_end(10)
-        backup_box.set_margin_top(10)
-        backup_box.set_margin_bottom(10)
+        _pad(backup_box, 10)
         scrolled.add(backup_box)
 
-        backups = list_backups(str(BACKUPS_DIR))
+        backups = _list_backups_cached()
         first_radio = None
         if backups:
-            for bk in sorted(backups, key=lambda x: x.get('date', ''), reverse=True):
+            for bk in backups:
                 text = f"{bk.get('date', 'Unknown date')} - {bk.get('state', '?')} v{bk.get('version', '?')}"
                 if bk.get('description'):
                     text += f" - {bk['description']}"
@@ -1488,30 +1858,24 @@ class RestoreDialog(Gtk.Dialog):
                 if first_radio is None:
                     radio = Gtk.RadioButton.new_with_label(None, text)
                     first_radio = radio
+                    self.selected_backup = bk
                 else:
                     radio = Gtk.RadioButton.new_with_label_from_widget(first_radio, text)
-                radio.backup_info = bk
-                radio.connect("toggled", self._on_backup_toggled)
+                radio.connect("toggled", self._on_backup_toggled, bk)
                 backup_box.pack_start(radio, False, False, 0)
-
-            first_radio.set_active(True)
-            self.selected_backup = first_radio.backup_info
         else:
             backup_box.pack_start(Gtk.Label(label="No backups found."), False, False, 0)
 
         # Category selection
         cat_frame = Gtk.Frame(label="Select data to restore")
         cat_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        cat_box.set_margin_start(15)
-        cat_box.set_margin_end(15)
-        cat_box.set_margin_top(10)
-        cat_box.set_margin_bottom(10)
+        _pad(cat_box, 15, 10)
         cat_frame.add(cat_box)
         content.pack_start(cat_frame, False, False, 0)
 
         self.category_checks = {}
-        for key, cat in BACKUP_CATEGORIES.items():
-            cb = Gtk.CheckButton(label=cat['label'])
+        for key, label in _BACKUP_CAT_LIST:
+            cb = Gtk.CheckButton(label=label)
             cb.set_active(True)
             self.category_checks[key] = cb
             cat_box.pack_start(cb, False, False, 0)
@@ -1519,9 +1883,9 @@ class RestoreDialog(Gtk.Dialog):
         self.connect("response", self._on_response)
         self.show_all()
 
-    def _on_backup_toggled(self, button):
+    def _on_backup_toggled(self, button, backup_info):
         if button.get_active():
-            self.selected_backup = button.backup_info
+            self.selected_backup = backup_info
 
     def _on_response(self, dialog, response):
         if response == Gtk.ResponseType.OK and self.selected_backup:
@@ -1535,7 +1899,7 @@ class RestoreDialog(Gtk.Dialog):
             def worker():
                 def cb(cat, current_file, done, total):
                     frac = done / max(total, 1)
-                    GLib.idle_add(progress.set_progress, frac, f"[{cat}] {current_file}")
+                    progress.post_progress(frac, "[{}] {}", cat, current_file)
 
                 success, msg = restore_backup(
                     self.selected_backup['path'], self.mount_point, categories, cb
@@ -1547,13 +1911,75 @@ class RestoreDialog(Gtk.Dialog):
                 else:
                     GLib.idle_add(self.parent_window._show_error_and_close_progress, progress, msg)
 
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
+            self.parent_window._run_in_background(worker, progress)
+
+
+def _deps_stamp(tool_dirs):
+    """Return a string that changes whenever installed tools may have changed.
+
+    Combines the mtime of dpkg's status file with those of *tool_dirs*
+    (a directory's mtime changes when files are added to or removed from it).
+    """
+    mtimes = []
+    for path in ("/var/lib/dpkg/status", *tool_dirs):
+        try:
+            mtimes.append(str(os.stat(path).st_mtime_ns))
+        except OSError:
+            mtimes.append("0")
+    return " ".join(mtimes)
+
+
+def _list_commands(tool_dirs):
+    """Return the names of executable files in *tool_dirs*, one scandir per directory.
+
+    Like shutil.which, only regular files (or symlinks to them) with the
+    execute bit count as commands.
+    """
+    names = set()
+    for path in tool_dirs:
+        try:
+            with os.scandir(path) as it:
+                names.update(
+                    entry.name for entry in it
+                    if entry.is_file() and os.access(entry.path, os.X_OK)
+                )
+        except OSError:
+            continue
+    return names
+
+
+def _dpkg_installed(packages):
+    """Return the subset of *packages* that dpkg reports as installed.
+
+    All packages are queried in a single dpkg-query call. Returns an empty
+    set on systems without dpkg.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["dpkg-query", "-W", "-f", "${Package}\t${db:Status-Status}\n",
+             *sorted(packages)],
+            capture_output=True, text=True,
+        )
+    except OSError:
+        return set()
+    installed = set()
+    for line in result.stdout.splitlines():
+        name, _, status = line.partition("\t")
+        if status == "installed":
+            installed.add(name)
+    return installed
 
 
 def check_dependencies():
-    """Check for required system tools and offer to install missing ones."""
-    import shutil
+    """Check for required system tools and offer to install missing ones.
+
+    A successful check is remembered in DEPS_STAMP_PATH together with
+    _deps_stamp(); while the stamp still matches, later launches skip the
+    lookup entirely.
+    """
+    import subprocess
 
     REQUIRED_TOOLS = {
         "parted":    "parted",
@@ -1568,14 +1994,28 @@ def check_dependencies():
         "lsblk":     "util-linux",
     }
 
-    missing_pkgs = set()
-    for cmd, pkg in REQUIRED_TOOLS.items():
-        if not (shutil.which(cmd)
-                or os.path.isfile(f"/sbin/{cmd}")
-                or os.path.isfile(f"/usr/sbin/{cmd}")):
-            missing_pkgs.add(pkg)
+    # $PATH plus the sbin directories, which are often not on a user's PATH
+    tool_dirs = list(dict.fromkeys(
+        [d for d in os.environ.get("PATH", "").split(os.pathsep) if d]
+        + ["/sbin", "/usr/sbin"]
+    ))
+    stamp = _deps_stamp(tool_dirs)
+    try:
+        if DEPS_STAMP_PATH.read_text(encoding="utf-8").strip() == stamp:
+            return True
+    except OSError:
+        pass
+
+    available = _list_commands(tool_dirs)
+    missing_pkgs = {pkg for cmd, pkg in REQUIRED_TOOLS.items() if cmd not in available}
+    if missing_pkgs:
+        missing_pkgs -= _dpkg_installed(missing_pkgs)
 
     if not missing_pkgs:
+        try:
+            DEPS_STAMP_PATH.write_text(stamp + "\n", encoding="utf-8")
+        except OSError:
+            pass  # read-only install; just check again next launch
         return True
 
     pkg_list = " ".join(sorted(missing_pkgs))
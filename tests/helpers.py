@@ -0,0 +1,65 @@
+"""
+helpers.py - Shared fixtures for the lib/ test suite.
+
+Provides a throwaway local HTTP server whose routes are plain dicts, so
+download code can be exercised (redirects, conditional requests, errors)
+without touching the network.
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _QuietServer(ThreadingHTTPServer):
+    """Skip tracebacks for clients that hang up mid-response (cancel tests)."""
+
+    def handle_error(self, request, client_address):
+        if issubclass(sys.exc_info()[0], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class LocalServer:
+    """HTTP server on 127.0.0.1 serving canned responses.
+
+    ``routes`` maps a request path to ``(status, headers, body)``; a
+    callable value is called with the handler and must return that tuple.
+    Every request is appended to ``requests`` as ``(path, headers)``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                route = server.routes.get(self.path, (404, {}, b"not found"))
+                if callable(route):
+                    route = route(self)
+                status, headers, body = route
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = _QuietServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
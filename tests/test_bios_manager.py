@@ -0,0 +1,170 @@
+import gc
+import hashlib
+import os
+import ssl
+import tempfile
+import threading
+import unittest
+import urllib.request
+import warnings
+from pathlib import Path
+from unittest import mock
+
+from lib import bios_manager, http_util
+from lib.bios_manager import BiosEntry, download_all_bios, download_bios_file, verify_md5
+from tests.helpers import LocalServer
+
+BODY = b"bios" * 64
+ENTRY = BiosEntry(
+    "test.bin", "GB", md5=hashlib.md5(BODY).hexdigest(), required=False, size=len(BODY),
+)
+
+
+class DownloadBiosFileTests(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.addCleanup(bios_manager._drop_connections)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        # No proxy from the test environment unless a test sets one.
+        env = mock.patch.dict(os.environ, {"no_proxy": "127.0.0.1"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _download(self, path):
+        with mock.patch.object(
+            bios_manager, "_build_download_url", return_value=self.server.url + path
+        ):
+            return download_bios_file(ENTRY, self.cache_dir)
+
+    def test_follows_redirects(self):
+        self.server.routes["/start"] = (302, {"Location": "/middle"}, b"")
+        self.server.routes["/middle"] = (301, {"Location": f"{self.server.url}/file"}, b"")
+        self.server.routes["/file"] = (200, {}, BODY)
+
+        ok, msg = self._download("/start")
+
+        self.assertTrue(ok, msg)
+        self.assertEqual((self.cache_dir / "test.bin").read_bytes(), BODY)
+        self.assertEqual([p for p, _ in self.server.requests], ["/start", "/middle", "/file"])
+
+    def test_redirect_loop_is_a_network_error(self):
+        self.server.routes["/loop"] = (302, {"Location": "/loop"}, b"")
+
+        ok, msg = self._download("/loop")
+
+        self.assertFalse(ok)
+        self.assertIn("Network error", msg)
+        self.assertEqual(len(self.server.requests), http_util.MAX_REDIRECTS + 1)
+
+    def test_http_error_status(self):
+        ok, msg = self._download("/missing")
+
+        self.assertFalse(ok)
+        self.assertIn("HTTP 404", msg)
+
+    def test_uses_configured_proxy(self):
+        # The local server plays the proxy: it receives the absolute URL.
+        target = "http://bios.invalid/file"
+        self.server.routes[target] = (200, {}, BODY)
+        # urlopen's default opener keeps the proxies it first saw
+        urllib.request.install_opener(None)
+        self.addCleanup(urllib.request.install_opener, None)
+
+        with mock.patch.dict(os.environ, {"http_proxy": self.server.url, "no_proxy": ""}), \
+                mock.patch.object(bios_manager, "_build_download_url", return_value=target):
+            ok, msg = download_bios_file(ENTRY, self.cache_dir)
+
+        self.assertTrue(ok, msg)
+        self.assertEqual(self.server.requests[0][0], target)
+
+    def test_ssl_error_is_a_network_error(self):
+        with mock.patch.object(bios_manager, "_open_download", side_effect=ssl.SSLError("bad record")):
+            ok, msg = download_bios_file(ENTRY, self.cache_dir)
+
+        self.assertFalse(ok)
+        self.assertIn("Network error", msg)
+
+    def test_md5_mismatch_removes_file(self):
+        self.server.routes["/file"] = (200, {}, b"x" * len(BODY))
+
+        ok, msg = self._download("/file")
+
+        self.assertFalse(ok)
+        self.assertIn("MD5 verification failed", msg)
+        self.assertFalse((self.cache_dir / "test.bin").exists())
+
+    def test_cancel_stops_download_and_removes_file(self):
+        self.server.routes["/big"] = (200, {}, b"x" * (4 * bios_manager.DOWNLOAD_CHUNK_SIZE))
+        cancel = threading.Event()
+        big = BiosEntry("big.bin", "GB", md5="", required=False)
+
+        with mock.patch.object(
+            bios_manager, "_build_download_url", return_value=self.server.url + "/big"
+        ):
+            ok, msg = download_bios_file(
+                big, self.cache_dir, progress_cb=lambda *a: cancel.set(), cancel_event=cancel
+            )
+
+        self.assertFalse(ok)
+        self.assertIn("cancelled", msg)
+        self.assertFalse((self.cache_dir / "big.bin").exists())
+
+    def test_set_cancel_event_skips_request(self):
+        cancel = threading.Event()
+        cancel.set()
+
+        with mock.patch.object(
+            bios_manager, "_build_download_url", return_value=self.server.url + "/file"
+        ):
+            ok, _msg = download_bios_file(ENTRY, self.cache_dir, cancel_event=cancel)
+
+        self.assertFalse(ok)
+        self.assertEqual(self.server.requests, [])
+
+    def test_download_all_closes_worker_connections(self):
+        entries = tuple(
+            BiosEntry(f"f{i}.bin", "GB", md5=ENTRY.md5, required=True, size=len(BODY))
+            for i in range(6)
+        )
+        for entry in entries:
+            self.server.routes[f"/{entry.filename}"] = (200, {}, BODY)
+
+        with mock.patch.object(bios_manager, "BIOS_FILES", entries), \
+                mock.patch.object(bios_manager, "_build_download_url",
+                                  side_effect=lambda e: f"{self.server.url}/{e.filename}"), \
+                warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            ok, succeeded, failed = download_all_bios(self.cache_dir, skip_cached=False)
+            gc.collect()
+
+        self.assertTrue(ok, failed)
+        self.assertEqual(len(succeeded), len(entries))
+        leaks = [w for w in caught if issubclass(w.category, ResourceWarning)]
+        self.assertEqual(leaks, [])
+
+
+class VerifyMd5Tests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "bios.bin"
+        self.path.write_bytes(BODY)
+
+    def test_matching_digest_and_size(self):
+        self.assertTrue(verify_md5(self.path, ENTRY.md5, len(BODY)))
+
+    def test_wrong_size_fails(self):
+        self.assertFalse(verify_md5(self.path, ENTRY.md5, len(BODY) + 1))
+
+    def test_wrong_digest_fails(self):
+        self.assertFalse(verify_md5(self.path, "0" * 32))
+
+    def test_empty_digest_skips_check(self):
+        self.assertTrue(verify_md5(self.path, ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
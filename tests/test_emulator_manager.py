@@ -0,0 +1,87 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from lib import emulator_manager
+from lib.emulator_manager import (
+    PACKAGE_DATA_DIR, install_package, invalidate_package_scan, scan_packages_cached,
+)
+
+
+class ScanPackagesCachedTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.sd = Path(tmp.name)
+        self.addCleanup(invalidate_package_scan, self.sd)
+        self.old = time.time() - 60
+        for rel in (f"{PACKAGE_DATA_DIR}/Emu/GBA", f"{PACKAGE_DATA_DIR}/Emu/SFC",
+                    "Emu", "Roms/GBA", "Roms/SFC"):
+            (self.sd / rel).mkdir(parents=True)
+        (self.sd / "Roms/SFC/game.sfc").write_bytes(b"rom")
+        self._age_tree()
+
+        scan = mock.patch.object(
+            emulator_manager, "scan_packages", wraps=emulator_manager.scan_packages
+        )
+        self.scan = scan.start()
+        self.addCleanup(scan.stop)
+
+    def _age_tree(self):
+        """Set every mtime to self.old, as if the card was written a while ago."""
+        for dirpath, dirnames, filenames in os.walk(self.sd):
+            for name in dirnames + filenames:
+                os.utime(os.path.join(dirpath, name), (self.old, self.old))
+        os.utime(self.sd, (self.old, self.old))
+
+    def _has_roms(self, packages):
+        return {p["name"]: p["has_roms"] for p in packages}
+
+    def test_unchanged_card_is_scanned_once(self):
+        first = scan_packages_cached(self.sd)
+        second = scan_packages_cached(self.sd)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.scan.call_count, 1)
+
+    def test_adding_a_rom_invalidates(self):
+        self.assertEqual(self._has_roms(scan_packages_cached(self.sd)), {"GBA": False, "SFC": True})
+
+        (self.sd / "Roms/GBA/game.gba").write_bytes(b"rom")
+
+        self.assertEqual(self._has_roms(scan_packages_cached(self.sd)), {"GBA": True, "SFC": True})
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_removing_a_rom_invalidates(self):
+        scan_packages_cached(self.sd)
+
+        (self.sd / "Roms/SFC/game.sfc").unlink()
+
+        self.assertEqual(self._has_roms(scan_packages_cached(self.sd)), {"GBA": False, "SFC": False})
+
+    def test_install_invalidates(self):
+        scan_packages_cached(self.sd)
+        ok, msg = install_package(self.sd, "GBA", "emu")
+        self.assertTrue(ok, msg)
+        # Same mtimes as the cached scan: only the explicit invalidation helps
+        self._age_tree()
+
+        installed = {p["name"]: p["installed"] for p in scan_packages_cached(self.sd)}
+
+        self.assertEqual(installed, {"GBA": True, "SFC": False})
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_recently_changed_card_is_not_cached(self):
+        (self.sd / "Roms/GBA/game.gba").write_bytes(b"rom")
+
+        scan_packages_cached(self.sd)
+        scan_packages_cached(self.sd)
+
+        self.assertEqual(self.scan.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
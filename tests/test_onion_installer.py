@@ -0,0 +1,161 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.request
+from pathlib import Path
+from unittest import mock
+
+from lib import onion_installer
+from lib.onion_installer import download_release, fetch_releases, load_cached_releases
+from tests.helpers import LocalServer
+
+
+def _release(tag):
+    return {
+        "tag_name": tag, "name": tag, "prerelease": False, "published_at": "",
+        "assets": [{"name": "Onion.zip", "browser_download_url": f"https://example.invalid/{tag}.zip",
+                    "size": 1}],
+    }
+
+
+class LocalServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.addCleanup(onion_installer._github_pool.close)
+        env = mock.patch.dict(os.environ, {"no_proxy": "127.0.0.1"})
+        env.start()
+        self.addCleanup(env.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+
+class ReleasesServerTestCase(LocalServerTestCase):
+    """Serves a release list at /releases that honours If-None-Match."""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_path = self.tmp / "releases.json"
+        url = mock.patch.object(onion_installer, "ONION_RELEASES_URL", self.server.url + "/releases")
+        url.start()
+        self.addCleanup(url.stop)
+        self.etag = '"v1"'
+        self.releases = [_release("v4.3.0")]
+        self.server.routes["/releases"] = self._releases_route
+
+    def _releases_route(self, handler):
+        if handler.headers.get("If-None-Match") == self.etag:
+            return 304, {"ETag": self.etag}, b""
+        return 200, {"ETag": self.etag}, json.dumps(self.releases).encode()
+
+    def _tags(self, data):
+        return [r["tag_name"] for r in data["stable"]]
+
+
+class FetchReleasesCacheTests(ReleasesServerTestCase):
+    def test_fresh_cache_is_still_revalidated(self):
+        self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+        self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1][1].get("If-None-Match"), '"v1"')
+
+    def test_new_release_is_seen_immediately(self):
+        fetch_releases(self.cache_path)
+        self.etag = '"v2"'
+        self.releases = [_release("v4.4.0"), _release("v4.3.0")]
+
+        self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.4.0", "v4.3.0"])
+        self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.4.0", "v4.3.0"])
+
+    def test_falls_back_to_cache_when_unreachable(self):
+        fetch_releases(self.cache_path)
+        self.server.routes["/releases"] = (500, {}, b"")
+
+        self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+
+    def test_error_without_cache_raises(self):
+        self.server.routes["/releases"] = (500, {}, b"")
+
+        with self.assertRaises(ConnectionError):
+            fetch_releases(self.cache_path)
+
+    def test_load_cached_releases_reads_without_network(self):
+        self.assertIsNone(load_cached_releases(self.cache_path))
+        fetch_releases(self.cache_path)
+        self.server.routes["/releases"] = (500, {}, b"")
+
+        self.assertEqual(self._tags(load_cached_releases(self.cache_path)), ["v4.3.0"])
+        self.assertEqual(len(self.server.requests), 1)
+
+
+class GithubRedirectAndProxyTests(ReleasesServerTestCase):
+    def test_follows_api_redirect(self):
+        self.server.routes["/moved"] = (301, {"Location": "/releases"}, b"")
+
+        with mock.patch.object(onion_installer, "ONION_RELEASES_URL", self.server.url + "/moved"):
+            self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+            self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+
+        self.assertEqual(
+            [p for p, _ in self.server.requests], ["/moved", "/releases", "/moved", "/releases"]
+        )
+        self.assertEqual(self.server.requests[3][1].get("If-None-Match"), '"v1"')
+
+    def test_redirect_loop_raises(self):
+        self.server.routes["/loop"] = (302, {"Location": "/loop"}, b"")
+
+        with mock.patch.object(onion_installer, "ONION_RELEASES_URL", self.server.url + "/loop"):
+            with self.assertRaises(ConnectionError):
+                fetch_releases(self.cache_path)
+
+    def test_uses_configured_proxy(self):
+        # The local server plays the proxy: it receives the absolute URL.
+        target = "http://api.invalid/releases"
+        self.server.routes[target] = self._releases_route
+        # urlopen's default opener keeps the proxies it first saw
+        urllib.request.install_opener(None)
+        self.addCleanup(urllib.request.install_opener, None)
+
+        with mock.patch.dict(os.environ, {"http_proxy": self.server.url, "no_proxy": ""}), \
+                mock.patch.object(onion_installer, "ONION_RELEASES_URL", target):
+            self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+            # A 304 through the proxy reuses the cache
+            self.assertEqual(self._tags(fetch_releases(self.cache_path)), ["v4.3.0"])
+
+        self.assertEqual([p for p, _ in self.server.requests], [target, target])
+        self.assertEqual(self.server.requests[1][1].get("If-None-Match"), '"v1"')
+
+
+class DownloadReleaseTests(LocalServerTestCase):
+    def test_follows_asset_redirect(self):
+        # browser_download_url always answers with a 302 to the asset CDN
+        body = b"PK" + b"z" * 100
+        self.server.routes["/releases/download/v4.3.0/Onion.zip"] = (
+            302, {"Location": f"{self.server.url}/objects/Onion.zip"}, b"",
+        )
+        self.server.routes["/objects/Onion.zip"] = (200, {}, body)
+
+        path = download_release(self.server.url + "/releases/download/v4.3.0/Onion.zip", self.tmp)
+
+        self.assertEqual(path.name, "Onion.zip")
+        self.assertEqual(path.read_bytes(), body)
+
+    def test_cancel_removes_partial_file(self):
+        self.server.routes["/Onion.zip"] = (200, {}, b"z" * (4 * onion_installer.CHUNK_SIZE))
+        cancel = threading.Event()
+
+        with self.assertRaises(InterruptedError):
+            download_release(
+                self.server.url + "/Onion.zip", self.tmp,
+                progress_callback=lambda *a: cancel.set(), cancel_event=cancel,
+            )
+
+        self.assertFalse((self.tmp / "Onion.zip").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
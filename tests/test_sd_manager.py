@@ -0,0 +1,43 @@
+import json
+import subprocess
+import unittest
+from unittest import mock
+
+from lib import sd_manager
+
+
+def _lsblk(*devices):
+    stdout = json.dumps({"blockdevices": list(devices)})
+    return subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
+
+
+def _disk(**overrides):
+    dev = {"name": "sdb", "size": "29.7G", "type": "disk", "rm": True,
+           "model": "SD Card Reader ", "tran": "usb", "label": None}
+    dev.update(overrides)
+    return dev
+
+
+class ListRemovableDrivesTests(unittest.TestCase):
+    def _drives(self, *devices):
+        with mock.patch.object(sd_manager, "_run", return_value=_lsblk(*devices)):
+            return sd_manager.list_removable_drives()
+
+    def test_display_format(self):
+        (drive,) = self._drives(_disk())
+        self.assertEqual(drive["display"], "/dev/sdb - 29.7G - SD Card Reader")
+
+    def test_display_format_with_label(self):
+        (drive,) = self._drives(_disk(label="ONION"))
+        self.assertEqual(drive["display"], "/dev/sdb - 29.7G - SD Card Reader [ONION]")
+
+    def test_display_format_without_model(self):
+        (drive,) = self._drives(_disk(model=None))
+        self.assertEqual(drive["display"], "/dev/sdb - 29.7G - ")
+
+    def test_skips_fixed_disks(self):
+        self.assertEqual(self._drives(_disk(rm=False), _disk(name="loop0", type="loop")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()